@@ -97,8 +97,10 @@ class ShutdownManager:
         try:
             logger.info("Saving all data...")
             
-            # Force save all JSON data
+            # Stop cached write-backs, then force save all JSON data
             from storage.json_engine import JSONEngine
+            from storage.write_cache import write_cache
+            await write_cache.close()
             JSONEngine.force_save_all()
             
             logger.info("✅ All data saved!")
@@ -6,13 +6,89 @@ Calculate similarity between texts
 """
 
 import re
+import os
+import sys
+import asyncio
 import logging
+import weakref
 from typing import Dict, Any, List, Tuple, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from operator import mul
 import math
 
 logger = logging.getLogger(__name__)
 
+# Single-pass cleaner: URLs, mentions/hashtags and punctuation runs
+_CLEAN_RE = re.compile(
+    r'http\S+|www\S+|[@#](?:(?!http\S|www\S)\w)+|[^\w\s@#]+|[@#]'
+)
+
+# ASCII fast path: strip URLs/mentions by regex, then blank every other
+# non-word, non-space character with one str.translate sweep
+_URL_MENTION_RE = re.compile(r'http\S+|www\S+|[@#](?:(?!http\S|www\S)\w)+')
+_ASCII_PUNCT_TABLE = str.maketrans({
+    char: ' ' for char in map(chr, range(128)) if not re.match(r'[\w\s]', char)
+})
+
+# Cleaned text, token counts, token set, vector norm
+PreparedText = Tuple[str, Counter, frozenset, float]
+
+def _dot(counts1: Counter, counts2: Counter) -> int:
+    """Dot product of two sparse word-count vectors"""
+    # Walk the smaller vector; map/sum keep the loop in C
+    if len(counts1) > len(counts2):
+        counts1, counts2 = counts2, counts1
+    return sum(map(mul, counts1.values(), map(counts2.get, counts1, repeat(0))))
+
+def _norm(counts: Counter) -> float:
+    """Euclidean norm of a sparse word-count vector"""
+    values = counts.values()
+    return math.sqrt(sum(map(mul, values, values)))
+
+def _levenshtein_distance(text1: str, text2: str) -> int:
+    """Levenshtein distance via Myers/Hyyro bit-parallel algorithm
+    
+    Each column of the DP matrix is packed into one (arbitrary-size) int,
+    so the Python-level loop runs once per character of text2.
+    """
+    # Loop over the shorter text; the longer one becomes the bit vector
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    if not text2:
+        return len(text1)
+    
+    # Bitmask of positions in text1 for each character
+    char_masks = {}
+    bit = 1
+    for char in text1:
+        char_masks[char] = char_masks.get(char, 0) | bit
+        bit <<= 1
+    
+    vp = (1 << len(text1)) - 1  # Vertical +1 deltas
+    vn = 0                      # Vertical -1 deltas
+    last_bit = 1 << (len(text1) - 1)
+    distance = len(text1)
+    
+    for char in text2:
+        eq = char_masks.get(char, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        
+        if hp & last_bit:
+            distance += 1
+        elif hn & last_bit:
+            distance -= 1
+        
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = hn | ~(d0 | hp)
+        vn = hp & d0
+    
+    return distance
+
 class SimilarityEngine:
     """Text Similarity Calculation Engine"""
     
@@ -33,6 +109,12 @@ class SimilarityEngine:
         # Cache for frequently calculated similarities
         self.similarity_cache = {}
         self.cache_size = 1000
+        
+        # Worker pool for large find_similar/calculate_batch calls (created
+        # on first use, released by close())
+        self.max_workers = os.cpu_count() or 1
+        self.parallel_min_items = 32
+        self._executor = None
     
     async def calculate(self, text1: str, text2: str, 
                        method: str = 'combined') -> float:
@@ -71,23 +153,24 @@ class SimilarityEngine:
     
     async def _clean_text(self, text: str) -> str:
         """Clean text for similarity calculation"""
+        return self._normalize_text(text)
+    
+    def _normalize_text(self, text: str) -> str:
+        """Clean text for similarity calculation (synchronous)"""
         if not text:
             return ""
         
-        # Convert to lowercase
+        # Lowercase, then drop URLs, mentions, hashtags and special characters
         text = text.lower()
-        
-        # Remove URLs, mentions, hashtags
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text)
-        text = re.sub(r'@\w+|#\w+', '', text)
-        
-        # Remove special characters but keep letters and numbers
-        text = re.sub(r'[^\w\s]', ' ', text)
+        if text.isascii():
+            if 'http' in text or 'www' in text or '@' in text or '#' in text:
+                text = _URL_MENTION_RE.sub(' ', text)
+            text = text.translate(_ASCII_PUNCT_TABLE)
+        else:
+            text = _CLEAN_RE.sub(' ', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return ' '.join(text.split())
     
     async def _cosine_similarity(self, text1: str, text2: str) -> float:
         """Calculate cosine similarity"""
@@ -95,19 +178,12 @@ class SimilarityEngine:
         vec1 = Counter(text1.split())
         vec2 = Counter(text2.split())
         
-        # Get all unique words
-        words = set(vec1.keys()) | set(vec2.keys())
-        
-        # Create vectors
-        vec1_list = [vec1.get(word, 0) for word in words]
-        vec2_list = [vec2.get(word, 0) for word in words]
-        
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1_list, vec2_list))
+        # Calculate dot product (only shared words contribute)
+        dot_product = _dot(vec1, vec2)
         
         # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vec1_list))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2_list))
+        magnitude1 = _norm(vec1)
+        magnitude2 = _norm(vec2)
         
         # Avoid division by zero
         if magnitude1 == 0 or magnitude2 == 0:
@@ -121,8 +197,8 @@ class SimilarityEngine:
     async def _jaccard_similarity(self, text1: str, text2: str) -> float:
         """Calculate Jaccard similarity"""
         # Convert to sets of words
-        set1 = set(text1.split())
-        set2 = set(text2.split())
+        set1 = frozenset(text1.split())
+        set2 = frozenset(text2.split())
         
         # Avoid division by zero
         if not set1 and not set2:
@@ -130,9 +206,9 @@ class SimilarityEngine:
         if not set1 or not set2:
             return 0.0  # One is empty
         
-        # Calculate intersection and union
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        # Calculate intersection and union (inclusion-exclusion)
+        intersection = len(set1 & set2)
+        union = len(set1) + len(set2) - intersection
         
         # Jaccard similarity
         similarity = intersection / union
@@ -141,6 +217,16 @@ class SimilarityEngine:
     
     async def _levenshtein_similarity(self, text1: str, text2: str) -> float:
         """Calculate Levenshtein distance-based similarity"""
+        return self._levenshtein_ratio(text1, text2)
+    
+    def _levenshtein_ratio(self, text1: str, text2: str,
+                           min_ratio: Optional[float] = None) -> float:
+        """Levenshtein distance-based similarity (synchronous)
+        
+        When min_ratio is given and the length difference alone caps the
+        ratio below it, that upper bound is returned without computing the
+        distance.
+        """
         # Implementation of Levenshtein distance
         if not text1 and not text2:
             return 1.0
@@ -151,34 +237,21 @@ class SimilarityEngine:
         text1 = text1.lower()
         text2 = text2.lower()
         
-        # Initialize matrix
         len1, len2 = len(text1), len(text2)
         max_len = max(len1, len2)
         
         if max_len == 0:
             return 1.0
         
-        # Create matrix
-        matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-        
-        # Initialize first row and column
-        for i in range(len1 + 1):
-            matrix[i][0] = i
-        for j in range(len2 + 1):
-            matrix[0][j] = j
-        
-        # Fill matrix
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                cost = 0 if text1[i - 1] == text2[j - 1] else 1
-                matrix[i][j] = min(
-                    matrix[i - 1][j] + 1,      # deletion
-                    matrix[i][j - 1] + 1,      # insertion
-                    matrix[i - 1][j - 1] + cost  # substitution
-                )
+        # Distance is at least the length difference
+        if min_ratio is not None:
+            upper_bound = 1 - abs(len1 - len2) / max_len
+            if upper_bound < min_ratio - 1e-9:
+                return upper_bound
+        
+        distance = _levenshtein_distance(text1, text2)
         
         # Calculate similarity
-        distance = matrix[len1][len2]
         similarity = 1 - (distance / max_len)
         
         return max(0.0, similarity)  # Ensure non-negative
@@ -199,6 +272,133 @@ class SimilarityEngine:
         
         return combined
     
+    def _prepare_text(self, text: str) -> Optional[PreparedText]:
+        """Clean and tokenize a text once for repeated comparison"""
+        if not text:
+            return None
+        
+        clean = self._normalize_text(text)
+        counts = Counter(map(sys.intern, clean.split()))
+        norm = _norm(counts)
+        
+        return (clean, counts, frozenset(counts), norm)
+    
+    def _prepare_batch(self, texts: List[str]) -> List[Optional[PreparedText]]:
+        """Clean and tokenize texts once for pairwise comparison"""
+        return [self._prepare_text(text) for text in texts]
+    
+    def _prepared_cosine(self, first: PreparedText, second: PreparedText) -> float:
+        """Cosine similarity between two prepared texts"""
+        _, counts1, _, norm1 = first
+        _, counts2, _, norm2 = second
+        
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+        
+        return _dot(counts1, counts2) / (norm1 * norm2)
+    
+    def _prepared_jaccard(self, first: PreparedText, second: PreparedText) -> float:
+        """Jaccard similarity between two prepared texts"""
+        tokens1, tokens2 = first[2], second[2]
+        
+        if not tokens1 and not tokens2:
+            return 1.0  # Both are empty
+        if not tokens1 or not tokens2:
+            return 0.0  # One is empty
+        
+        # Union size by inclusion-exclusion, without building the union set
+        intersection = len(tokens1 & tokens2)
+        return intersection / (len(tokens1) + len(tokens2) - intersection)
+    
+    def _prepared_similarity(self, first: Optional[PreparedText],
+                             second: Optional[PreparedText],
+                             method: str = 'combined',
+                             threshold: Optional[float] = None) -> float:
+        """Calculate similarity between two prepared texts
+        
+        With a threshold, scores that cannot reach it may be returned as a
+        cheaper upper bound (still below the threshold).
+        """
+        # Empty input never matches (same as calculate)
+        if first is None or second is None:
+            return 0.0
+        
+        if method == 'cosine':
+            return self._prepared_cosine(first, second)
+        if method == 'jaccard':
+            return self._prepared_jaccard(first, second)
+        if method == 'levenshtein':
+            return self._levenshtein_ratio(first[0], second[0], threshold)
+        
+        partial = (
+            self.weights['cosine'] * self._prepared_cosine(first, second) +
+            self.weights['jaccard'] * self._prepared_jaccard(first, second)
+        )
+        
+        # Levenshtein ratio needed for the combined score to reach threshold
+        needed = None
+        if threshold is not None and self.weights['levenshtein'] > 0:
+            needed = (threshold - partial) / self.weights['levenshtein']
+        
+        return partial + (
+            self.weights['levenshtein'] * self._levenshtein_ratio(first[0], second[0], needed)
+        )
+    
+    def _score_against(self, target: Optional[PreparedText],
+                       candidates: List[Optional[PreparedText]],
+                       method: str = 'combined',
+                       threshold: Optional[float] = None) -> List[float]:
+        """Score prepared candidates against a prepared target"""
+        return [
+            self._prepared_similarity(target, candidate, method, threshold)
+            for candidate in candidates
+        ]
+    
+    def _first_match(self, target: Optional[PreparedText],
+                     candidates: List[Optional[PreparedText]],
+                     threshold: float) -> Optional[int]:
+        """Index of the first prepared candidate reaching threshold"""
+        for index, candidate in enumerate(candidates):
+            if self._prepared_similarity(target, candidate, 'combined', threshold) >= threshold:
+                return index
+        return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the scoring worker pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="similarity"
+            )
+            # Engines dropped without close() still release their threads
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+    
+    def close(self):
+        """Shut down the scoring worker pool"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    async def _run_chunked(self, func, items: List) -> List[Any]:
+        """Run func(offset, chunk) over slices of items on the worker pool
+        
+        Meant for one dispatch per batch; the scoring is pure Python, so the
+        pool keeps large batches off the event loop rather than speeding
+        them up.
+        """
+        if len(items) < self.parallel_min_items or self.max_workers < 2:
+            return [func(0, items)]
+        
+        size = -(-len(items) // self.max_workers)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        
+        return await asyncio.gather(*[
+            loop.run_in_executor(executor, func, start, items[start:start + size])
+            for start in range(0, len(items), size)
+        ])
+    
     def _add_to_cache(self, key: str, value: float):
         """Add similarity to cache"""
         # Limit cache size
@@ -210,18 +410,44 @@ class SimilarityEngine:
         
         self.similarity_cache[key] = value
     
+    async def calculate_batch(self, query: str, texts: List[str],
+                              method: str = 'combined') -> List[float]:
+        """Calculate similarity between query and each text in one pass"""
+        if method not in self.methods:
+            logger.warning(f"Unknown similarity method: {method}")
+            method = 'combined'
+        
+        return await self._score_batch(query, texts, method)
+    
+    async def _score_batch(self, query: str, texts: List[str], method: str,
+                           threshold: Optional[float] = None) -> List[float]:
+        """Score texts against query; below-threshold scores may be upper bounds"""
+        if not texts:
+            return []
+        
+        # Clean and tokenize everything once, query included
+        target = self._prepare_text(query)
+        candidates = self._prepare_batch(texts)
+        
+        # Score slices of the candidates concurrently off the event loop
+        chunks = await self._run_chunked(
+            lambda offset, chunk: self._score_against(target, chunk, method, threshold),
+            candidates
+        )
+        
+        return [score for chunk in chunks for score in chunk]
+    
     async def find_similar(self, query: str, texts: List[str], 
                           threshold: float = 0.5) -> List[Tuple[str, float]]:
         """Find texts similar to query"""
         if not query or not texts:
             return []
         
-        similarities = []
-        
-        for text in texts:
-            similarity = await self.calculate(query, text, 'combined')
-            if similarity >= threshold:
-                similarities.append((text, similarity))
+        scores = await self._score_batch(query, texts, 'combined', threshold)
+        similarities = [
+            (text, similarity) for text, similarity in zip(texts, scores)
+            if similarity >= threshold
+        ]
         
         # Sort by similarity (highest first)
         similarities.sort(key=lambda x: x[1], reverse=True)
@@ -233,17 +459,14 @@ class SimilarityEngine:
         if not query or not texts:
             return None
         
-        best_similarity = -1.0
-        best_text = None
+        scores = await self._score_batch(query, texts, 'combined', self.min_similarity)
         
-        for text in texts:
-            similarity = await self.calculate(query, text, 'combined')
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_text = text
+        # First text with the highest score wins
+        best_index = max(range(len(texts)), key=scores.__getitem__)
+        best_similarity = scores[best_index]
         
         if best_similarity >= self.min_similarity:
-            return (best_text, best_similarity)
+            return (texts[best_index], best_similarity)
         
         return None
     
@@ -254,37 +477,87 @@ class SimilarityEngine:
             return []
         
         clusters = []
+        representatives = []  # Prepared first text of each cluster
+        
+        # Token -> ids of clusters whose representative contains it. A cluster
+        # sharing no token with a text scores at most the Levenshtein weight,
+        # so above that threshold only indexed clusters need checking.
+        token_index: Dict[str, List[int]] = {}
+        use_index = threshold > self.weights['levenshtein']
         
         for text in texts:
-            added = False
+            target = self._prepare_text(text)
+            
+            if use_index:
+                candidate_ids = self._candidate_clusters(target, token_index)
+            else:
+                candidate_ids = list(range(len(representatives)))
+            candidates = [representatives[cid] for cid in candidate_ids]
             
-            # Try to add to existing cluster
-            for cluster in clusters:
-                # Check similarity with cluster representative (first text)
-                if cluster:
-                    similarity = await self.calculate(text, cluster[0], 'combined')
-                    if similarity >= threshold:
-                        cluster.append(text)
-                        added = True
-                        break
+            # Find the first cluster whose representative is similar enough.
+            # Runs inline: a pool dispatch per text costs more than the
+            # GIL-bound scoring it would spread out
+            match = self._first_match(target, candidates, threshold)
             
-            # Create new cluster if not added
-            if not added:
+            if match is not None:
+                clusters[candidate_ids[match]].append(text)
+            else:
+                # Create new cluster
+                if target is not None:
+                    for token in (target[2] or ('',)):
+                        token_index.setdefault(token, []).append(len(clusters))
                 clusters.append([text])
+                representatives.append(target)
         
         return clusters
     
+    def _candidate_clusters(self, target: Optional[PreparedText],
+                            token_index: Dict[str, List[int]]) -> List[int]:
+        """Cluster ids sharing at least one token with target, in creation order"""
+        if target is None:
+            return []
+        
+        # Texts without tokens are indexed under the empty string
+        candidate_ids = set()
+        for token in (target[2] or ('',)):
+            candidate_ids.update(token_index.get(token, ()))
+        
+        return sorted(candidate_ids)
+    
     async def calculate_similarity_matrix(self, texts: List[str]) -> List[List[float]]:
         """Calculate similarity matrix for multiple texts"""
         n = len(texts)
-        matrix = [[0.0] * n for _ in range(n)]
         
+        # Clean and tokenize each text once instead of once per pair
+        prepared = self._prepare_batch(texts)
+        
+        # Texts that clean to the same string score identically, so only
+        # distinct ones are compared and the results are broadcast
+        slots = {}
+        distinct = []
+        groups = []
+        for entry in prepared:
+            key = None if entry is None else entry[0]
+            if key not in slots:
+                slots[key] = len(distinct)
+                distinct.append(entry)
+            groups.append(slots[key])
+        
+        r = len(distinct)
+        scores = [[0.0] * r for _ in range(r)]
+        duplicated = {slot for slot, count in Counter(groups).items() if count > 1}
+        
+        for a in range(r):
+            if a in duplicated:
+                scores[a][a] = self._prepared_similarity(distinct[a], distinct[a])
+            for b in range(a + 1, r):
+                similarity = self._prepared_similarity(distinct[a], distinct[b])
+                scores[a][b] = similarity
+                scores[b][a] = similarity  # Symmetric
+        
+        matrix = [[scores[slot][other] for other in groups] for slot in groups]
         for i in range(n):
             matrix[i][i] = 1.0  # Self-similarity
-            for j in range(i + 1, n):
-                similarity = await self.calculate(texts[i], texts[j], 'combined')
-                matrix[i][j] = similarity
-                matrix[j][i] = similarity  # Symmetric
         
         return matrix
     
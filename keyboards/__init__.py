@@ -9,15 +9,17 @@ __author__ = "RANA (MASTER)"
 from .start import StartKeyboard
 from .main_menu import MainMenuKeyboard
 from .admin_menu import AdminMenuKeyboard
-from .group_admin_menu import GroupAdminMenuKeyboard
-from .payment_menu import PaymentMenuKeyboard
+from .group_admin_menu import GroupAdminMenu
+from .payment_menu import PaymentMenu
 from .confirmation import ConfirmationKeyboard
+from .markup import to_markup
 
 __all__ = [
     'StartKeyboard',
     'MainMenuKeyboard',
     'AdminMenuKeyboard',
-    'GroupAdminMenuKeyboard',
-    'PaymentMenuKeyboard',
+    'GroupAdminMenu',
+    'PaymentMenu',
     'ConfirmationKeyboard',
+    'to_markup',
 ]
\ No newline at end of file
@@ -5,197 +5,135 @@ Blue Rose Bot - Confirmation Keyboards
 Confirmation dialogs for various actions
 """
 
-import telebot.types as telebot_types
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+_PLAN_NAMES = {
+    'free': 'Free Trial (30 Days)',
+    'basic': 'Basic (30 Days - 60৳)',
+    'standard': 'Standard (90 Days - 100৳)',
+    'premium': 'Premium (8 Months - 200৳)'
+}
+
+Rows = Tuple[Tuple[Dict[str, str], ...], ...]
+
+def _rows(*rows) -> Rows:
+    """Build immutable keyboard rows from rows of (label, callback_data) pairs"""
+    return tuple(
+        tuple({'text': label, 'callback_data': callback_data} for label, callback_data in row)
+        for row in rows
+    )
+
+def _markup(rows: Rows) -> Dict[str, Any]:
+    """Wrap rows in a fresh inline_keyboard dict"""
+    return {'inline_keyboard': rows}
+
+# Parameter-free dialogs are built once; the shared rows are tuples, so a
+# caller cannot change them for later requests
+_RESTART_SHUTDOWN = _rows(
+    (("🔄 Restart", "system:restart"), ("🔴 Shutdown", "system:shutdown")),
+    (("❌ Cancel", "system:cancel"),),
+)
+
+_EMERGENCY_ACTIONS = _rows(
+    (("🚨 Lockdown", "emergency:lockdown"), ("🔓 Release", "emergency:release")),
+    (("📴 Silent Mode", "emergency:silent"), ("❌ Cancel", "emergency:cancel")),
+)
+
+# Parameterized dialogs repeat for the same few (action, data) pairs, so
+# their rows are cached and shared
+@lru_cache(maxsize=512)
+def _yes_no(action: str, data: str = "") -> Rows:
+    base = f"confirm:{action}:{data}" if data else f"confirm:{action}"
+    return _rows((("✅ Yes", base + ":yes"), ("❌ No", base + ":no")))
+
+@lru_cache(maxsize=512)
+def _confirm_cancel(action: str, data: str = "") -> Rows:
+    suffix = f":{action}:{data}" if data else f":{action}"
+    return _rows((("✅ Confirm", "confirm" + suffix), ("❌ Cancel", "cancel" + suffix)))
+
+@lru_cache(maxsize=512)
+def _proceed_back(action: str, data: str = "") -> Rows:
+    suffix = f":{action}:{data}" if data else f":{action}"
+    return _rows((("➡️ Proceed", "proceed" + suffix), ("🔙 Back", "back" + suffix)))
+
+@lru_cache(maxsize=512)
+def _enable_disable(item_type: str, item_id: str) -> Rows:
+    suffix = f":{item_type}:{item_id}"
+    return _rows((("✅ Enable", "toggle:enable" + suffix), ("❌ Disable", "toggle:disable" + suffix)))
+
+@lru_cache(maxsize=512)
+def _approve_reject(request_id: str) -> Rows:
+    suffix = f":{request_id}"
+    return _rows(
+        (("✅ Approve", "approve" + suffix), ("❌ Reject", "reject" + suffix), ("📋 View", "view" + suffix))
+    )
+
+@lru_cache(maxsize=512)
+def _save_discard(action: str, data: str = "") -> Rows:
+    suffix = f":{action}:{data}" if data else f":{action}"
+    return _rows((("💾 Save", "save" + suffix), ("🗑️ Discard", "discard" + suffix)))
+
+@lru_cache(maxsize=512)
+def _delete_keep(item_type: str, item_id: str) -> Rows:
+    suffix = f":{item_type}:{item_id}"
+    return _rows((("🗑️ Delete", "delete" + suffix), ("💾 Keep", "keep" + suffix)))
 
 class ConfirmationKeyboard:
     """Confirmation Keyboards"""
     
     @staticmethod
-    def yes_no(action: str, data: str = "") -> telebot_types.InlineKeyboardMarkup:
+    def yes_no(action: str, data: str = "") -> Dict[str, Any]:
         """Simple Yes/No confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        if data:
-            callback_yes = f"confirm:{action}:{data}:yes"
-            callback_no = f"confirm:{action}:{data}:no"
-        else:
-            callback_yes = f"confirm:{action}:yes"
-            callback_no = f"confirm:{action}:no"
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("✅ Yes", callback_data=callback_yes),
-            telebot_types.InlineKeyboardButton("❌ No", callback_data=callback_no)
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_yes_no(action, data))
     
     @staticmethod
-    def confirm_cancel(action: str, data: str = "") -> telebot_types.InlineKeyboardMarkup:
+    def confirm_cancel(action: str, data: str = "") -> Dict[str, Any]:
         """Confirm/Cancel confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        if data:
-            callback_confirm = f"confirm:{action}:{data}"
-            callback_cancel = f"cancel:{action}:{data}"
-        else:
-            callback_confirm = f"confirm:{action}"
-            callback_cancel = f"cancel:{action}"
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("✅ Confirm", callback_data=callback_confirm),
-            telebot_types.InlineKeyboardButton("❌ Cancel", callback_data=callback_cancel)
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_confirm_cancel(action, data))
     
     @staticmethod
-    def proceed_back(action: str, data: str = "") -> telebot_types.InlineKeyboardMarkup:
+    def proceed_back(action: str, data: str = "") -> Dict[str, Any]:
         """Proceed/Back confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        if data:
-            callback_proceed = f"proceed:{action}:{data}"
-            callback_back = f"back:{action}:{data}"
-        else:
-            callback_proceed = f"proceed:{action}"
-            callback_back = f"back:{action}"
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("➡️ Proceed", callback_data=callback_proceed),
-            telebot_types.InlineKeyboardButton("🔙 Back", callback_data=callback_back)
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_proceed_back(action, data))
     
     @staticmethod
-    def enable_disable(item_type: str, item_id: str) -> telebot_types.InlineKeyboardMarkup:
+    def enable_disable(item_type: str, item_id: str) -> Dict[str, Any]:
         """Enable/Disable toggle"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Enable",
-                callback_data=f"toggle:enable:{item_type}:{item_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Disable",
-                callback_data=f"toggle:disable:{item_type}:{item_id}"
-            )
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_enable_disable(item_type, item_id))
     
     @staticmethod
-    def approve_reject(request_id: str) -> telebot_types.InlineKeyboardMarkup:
+    def approve_reject(request_id: str) -> Dict[str, Any]:
         """Approve/Reject confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=3)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("✅ Approve", callback_data=f"approve:{request_id}"),
-            telebot_types.InlineKeyboardButton("❌ Reject", callback_data=f"reject:{request_id}"),
-            telebot_types.InlineKeyboardButton("📋 View", callback_data=f"view:{request_id}")
-        ]
-        
-        keyboard.row(buttons[0], buttons[1], buttons[2])
-        return keyboard
+        return _markup(_approve_reject(request_id))
     
     @staticmethod
-    def save_discard(action: str, data: str = "") -> telebot_types.InlineKeyboardMarkup:
+    def save_discard(action: str, data: str = "") -> Dict[str, Any]:
         """Save/Discard changes"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        if data:
-            callback_save = f"save:{action}:{data}"
-            callback_discard = f"discard:{action}:{data}"
-        else:
-            callback_save = f"save:{action}"
-            callback_discard = f"discard:{action}"
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("💾 Save", callback_data=callback_save),
-            telebot_types.InlineKeyboardButton("🗑️ Discard", callback_data=callback_discard)
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_save_discard(action, data))
     
     @staticmethod
-    def delete_keep(item_type: str, item_id: str) -> telebot_types.InlineKeyboardMarkup:
+    def delete_keep(item_type: str, item_id: str) -> Dict[str, Any]:
         """Delete/Keep confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("🗑️ Delete", callback_data=f"delete:{item_type}:{item_id}"),
-            telebot_types.InlineKeyboardButton("💾 Keep", callback_data=f"keep:{item_type}:{item_id}")
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
+        return _markup(_delete_keep(item_type, item_id))
     
     @staticmethod
-    def restart_shutdown() -> telebot_types.InlineKeyboardMarkup:
+    def restart_shutdown() -> Dict[str, Any]:
         """Restart/Shutdown confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("🔄 Restart", callback_data="system:restart"),
-            telebot_types.InlineKeyboardButton("🔴 Shutdown", callback_data="system:shutdown"),
-            telebot_types.InlineKeyboardButton("❌ Cancel", callback_data="system:cancel")
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        keyboard.row(buttons[2])
-        return keyboard
+        return _markup(_RESTART_SHUTDOWN)
     
     @staticmethod
-    def emergency_actions() -> telebot_types.InlineKeyboardMarkup:
+    def emergency_actions() -> Dict[str, Any]:
         """Emergency actions confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton("🚨 Lockdown", callback_data="emergency:lockdown"),
-            telebot_types.InlineKeyboardButton("🔓 Release", callback_data="emergency:release"),
-            telebot_types.InlineKeyboardButton("📴 Silent Mode", callback_data="emergency:silent"),
-            telebot_types.InlineKeyboardButton("❌ Cancel", callback_data="emergency:cancel")
-        ]
-        
-        keyboard.row(buttons[0], buttons[1])
-        keyboard.row(buttons[2], buttons[3])
-        return keyboard
+        return _markup(_EMERGENCY_ACTIONS)
     
     @staticmethod
-    def plan_selection_confirmation(plan_type: str, group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def plan_selection_confirmation(plan_type: str, group_id: int) -> Dict[str, Any]:
         """Plan selection confirmation"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        plan_names = {
-            'free': 'Free Trial (30 Days)',
-            'basic': 'Basic (30 Days - 60৳)',
-            'standard': 'Standard (90 Days - 100৳)',
-            'premium': 'Premium (8 Months - 200৳)'
-        }
-        
-        plan_name = plan_names.get(plan_type, plan_type)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                f"✅ Select {plan_name}",
-                callback_data=f"plan:select:{plan_type}:{group_id}:confirm"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Change Plan",
-                callback_data=f"plan:change:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Cancel",
-                callback_data=f"plan:cancel:{group_id}"
-            )
-        ]
+        plan_name = _PLAN_NAMES.get(plan_type, plan_type)
+        gid = str(group_id)
         
-        keyboard.row(buttons[0])
-        keyboard.row(buttons[1], buttons[2])
-        return keyboard
\ No newline at end of file
+        return _markup(_rows(
+            ((f"✅ Select {plan_name}", f"plan:select:{plan_type}:{gid}:confirm"),),
+            (("🔄 Change Plan", "plan:change:" + gid), ("❌ Cancel", "plan:cancel:" + gid)),
+        ))
\ No newline at end of file
@@ -5,365 +5,179 @@ Blue Rose Bot - Group Admin Menu Keyboard
 Group administration keyboard layouts
 """
 
-from typing import List, Dict, Any
-import telebot.types as telebot_types
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+Rows = Tuple[Tuple[Dict[str, str], ...], ...]
+
+def _pack(buttons: List[Dict[str, str]]) -> Rows:
+    """Lay buttons out two per row as immutable rows"""
+    return tuple(tuple(buttons[i:i + 2]) for i in range(0, len(buttons), 2))
+
+def _layout(rows: Rows) -> Dict[str, Any]:
+    """Wrap shared rows in a fresh inline_keyboard dict"""
+    return {'inline_keyboard': rows}
+
+def _interned(*buttons):
+    """Intern a table of (label, prefix) pairs so menus share one copy"""
+    return tuple((sys.intern(label), sys.intern(prefix)) for label, prefix in buttons)
+
+# Button tables: (label, callback_data prefix); the group id is appended
+_MAIN_MENU_BUTTONS = _interned(
+    ("🛠️ Service Control", "group_admin:service_control:"),
+    ("📝 Message Settings", "group_admin:message_settings:"),
+    ("⏰ Time Settings", "group_admin:time_settings:"),
+    ("🛡️ Moderation", "group_admin:moderation:"),
+    ("💳 Payment/Plan", "group_admin:payment:"),
+    ("📊 Analytics", "group_admin:analytics:"),
+    ("🔓 Feature Unlock", "group_admin:feature_unlock:"),
+    ("👋 Welcome/Farewell", "group_admin:welcome_farewell:"),
+    ("🕌 Prayer Alerts", "group_admin:prayer_alerts:"),
+    ("📋 Templates", "group_admin:templates:"),
+    ("😊 Reaction Settings", "group_admin:reactions:"),
+    ("🤖 Auto-reply Settings", "group_admin:auto_reply:"),
+    ("📋 Report", "group_admin:report:"),
+)
+
+_SERVICE_CONTROL_BUTTONS = _interned(
+    ("✅ Master Service ON", "service:toggle:master:on:"),
+    ("❌ Master Service OFF", "service:toggle:master:off:"),
+    ("🤖 Auto-reply", "service:toggle:auto_reply:"),
+    ("🛡️ Moderation", "service:toggle:moderation:"),
+    ("👋 Welcome", "service:toggle:welcome:"),
+    ("👋 Farewell", "service:toggle:goodbye:"),
+    ("🕌 Prayer Alerts", "service:toggle:prayer_alerts:"),
+    ("⏰ Scheduled Messages", "service:toggle:scheduled:"),
+    ("🌙 Night Mode", "service:toggle:night_mode:"),
+    ("📊 Analytics", "service:toggle:analytics:"),
+    ("🔄 Reset All", "service:reset_all:"),
+    ("📋 Status Report", "service:report:"),
+    ("🔙 Back", "group_admin:main:"),
+)
+
+_MESSAGE_SETTINGS_BUTTONS = _interned(
+    ("📝 Edit Welcome", "message:edit:welcome:"),
+    ("📝 Edit Farewell", "message:edit:goodbye:"),
+    ("📋 Edit Templates", "message:edit:templates:"),
+    ("🕌 Edit Prayer Messages", "message:edit:prayer:"),
+    ("⏰ Edit Scheduled", "message:edit:scheduled:"),
+    ("🔔 Edit Alerts", "message:edit:alerts:"),
+    ("📖 View Defaults", "message:view_defaults:"),
+    ("🔄 Reset All", "message:reset_all:"),
+    ("🔙 Back", "group_admin:main:"),
+)
+
+_TIME_SETTINGS_BUTTONS = _interned(
+    ("⏰ Manage Time Slots", "time:manage_slots:"),
+    ("🌙 Night Mode", "time:night_mode:"),
+    ("🕌 Prayer Times", "time:prayer_times:"),
+    ("📅 Schedule Editor", "time:schedule_editor:"),
+    ("⏱️ Quiet Hours", "time:quiet_hours:"),
+    ("🔄 Reset Schedule", "time:reset_schedule:"),
+    ("📋 Schedule Report", "time:report:"),
+    ("🔙 Back", "group_admin:main:"),
+)
+
+_MODERATION_BUTTONS = _interned(
+    ("🛡️ General Settings", "moderation:general:"),
+    ("🚫 Anti-Spam", "moderation:anti_spam:"),
+    ("🌊 Anti-Flood", "moderation:anti_flood:"),
+    ("🔗 Anti-Link", "moderation:anti_link:"),
+    ("📤 Anti-Forward", "moderation:anti_forward:"),
+    ("🤖 Anti-Bot", "moderation:anti_bot:"),
+    ("⚡ Auto Actions", "moderation:auto_actions:"),
+    ("🛡️ Raid Protection", "moderation:raid_protection:"),
+    ("📋 Moderation Logs", "moderation:logs:"),
+    ("🔄 Reset Settings", "moderation:reset:"),
+    ("📋 Settings Report", "moderation:report:"),
+    ("🔙 Back", "group_admin:main:"),
+)
+
+# Menus keyed by name; footers carry fixed callbacks without the group id
+_MENUS = {
+    'main': _MAIN_MENU_BUTTONS,
+    'service_control': _SERVICE_CONTROL_BUTTONS,
+    'message_settings': _MESSAGE_SETTINGS_BUTTONS,
+    'time_settings': _TIME_SETTINGS_BUTTONS,
+    'moderation': _MODERATION_BUTTONS,
+}
+
+_MENU_FOOTERS = {
+    'main': (("🔙 Back", "main_menu"),),
+}
+
+@lru_cache(maxsize=1024)
+def _build_menu(name: str, group_id: int) -> Rows:
+    """Render the rows of a table-driven menu for a group"""
+    gid = str(group_id)
+    buttons = [
+        {'text': label, 'callback_data': prefix + gid}
+        for label, prefix in _MENUS[name]
+    ]
+    buttons.extend(
+        {'text': label, 'callback_data': callback_data}
+        for label, callback_data in _MENU_FOOTERS.get(name, ())
+    )
+    
+    return _pack(buttons)
 
 class GroupAdminMenu:
-    """Group Admin Menu Keyboard"""
+    """Group Admin Menu Keyboard
+    
+    Menus are inline_keyboard dicts whose rows are tuples. Table-driven
+    rows are cached per group and shared, so each call wraps them in its
+    own outer dict.
+    """
     
     @staticmethod
-    def main_menu(group_id: int = 0) -> telebot_types.InlineKeyboardMarkup:
+    def main_menu(group_id: int = 0) -> Dict[str, Any]:
         """Main group admin menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "🛠️ Service Control",
-                callback_data=f"group_admin:service_control:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📝 Message Settings",
-                callback_data=f"group_admin:message_settings:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Time Settings",
-                callback_data=f"group_admin:time_settings:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🛡️ Moderation",
-                callback_data=f"group_admin:moderation:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "💳 Payment/Plan",
-                callback_data=f"group_admin:payment:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📊 Analytics",
-                callback_data=f"group_admin:analytics:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔓 Feature Unlock",
-                callback_data=f"group_admin:feature_unlock:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "👋 Welcome/Farewell",
-                callback_data=f"group_admin:welcome_farewell:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🕌 Prayer Alerts",
-                callback_data=f"group_admin:prayer_alerts:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Templates",
-                callback_data=f"group_admin:templates:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "😊 Reaction Settings",
-                callback_data=f"group_admin:reactions:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🤖 Auto-reply Settings",
-                callback_data=f"group_admin:auto_reply:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Report",
-                callback_data=f"group_admin:report:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data="main_menu"
-            )
-        ]
-        
-        # Add buttons in rows
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_build_menu('main', group_id))
     
     @staticmethod
-    def service_control_menu(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def service_control_menu(group_id: int) -> Dict[str, Any]:
         """Service control menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Master Service ON",
-                callback_data=f"service:toggle:master:on:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Master Service OFF",
-                callback_data=f"service:toggle:master:off:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🤖 Auto-reply",
-                callback_data=f"service:toggle:auto_reply:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🛡️ Moderation",
-                callback_data=f"service:toggle:moderation:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "👋 Welcome",
-                callback_data=f"service:toggle:welcome:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "👋 Farewell",
-                callback_data=f"service:toggle:goodbye:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🕌 Prayer Alerts",
-                callback_data=f"service:toggle:prayer_alerts:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Scheduled Messages",
-                callback_data=f"service:toggle:scheduled:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🌙 Night Mode",
-                callback_data=f"service:toggle:night_mode:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📊 Analytics",
-                callback_data=f"service:toggle:analytics:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Reset All",
-                callback_data=f"service:reset_all:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Status Report",
-                callback_data=f"service:report:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"group_admin:main:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_build_menu('service_control', group_id))
     
     @staticmethod
-    def message_settings_menu(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def message_settings_menu(group_id: int) -> Dict[str, Any]:
         """Message settings menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "📝 Edit Welcome",
-                callback_data=f"message:edit:welcome:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📝 Edit Farewell",
-                callback_data=f"message:edit:goodbye:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Edit Templates",
-                callback_data=f"message:edit:templates:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🕌 Edit Prayer Messages",
-                callback_data=f"message:edit:prayer:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Edit Scheduled",
-                callback_data=f"message:edit:scheduled:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔔 Edit Alerts",
-                callback_data=f"message:edit:alerts:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📖 View Defaults",
-                callback_data=f"message:view_defaults:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Reset All",
-                callback_data=f"message:reset_all:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"group_admin:main:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_build_menu('message_settings', group_id))
     
     @staticmethod
-    def time_settings_menu(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def time_settings_menu(group_id: int) -> Dict[str, Any]:
         """Time settings menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "⏰ Manage Time Slots",
-                callback_data=f"time:manage_slots:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🌙 Night Mode",
-                callback_data=f"time:night_mode:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🕌 Prayer Times",
-                callback_data=f"time:prayer_times:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📅 Schedule Editor",
-                callback_data=f"time:schedule_editor:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏱️ Quiet Hours",
-                callback_data=f"time:quiet_hours:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Reset Schedule",
-                callback_data=f"time:reset_schedule:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Schedule Report",
-                callback_data=f"time:report:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"group_admin:main:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_build_menu('time_settings', group_id))
     
     @staticmethod
-    def moderation_menu(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def moderation_menu(group_id: int) -> Dict[str, Any]:
         """Moderation menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "🛡️ General Settings",
-                callback_data=f"moderation:general:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🚫 Anti-Spam",
-                callback_data=f"moderation:anti_spam:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🌊 Anti-Flood",
-                callback_data=f"moderation:anti_flood:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔗 Anti-Link",
-                callback_data=f"moderation:anti_link:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📤 Anti-Forward",
-                callback_data=f"moderation:anti_forward:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🤖 Anti-Bot",
-                callback_data=f"moderation:anti_bot:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⚡ Auto Actions",
-                callback_data=f"moderation:auto_actions:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🛡️ Raid Protection",
-                callback_data=f"moderation:raid_protection:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Moderation Logs",
-                callback_data=f"moderation:logs:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Reset Settings",
-                callback_data=f"moderation:reset:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Settings Report",
-                callback_data=f"moderation:report:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"group_admin:main:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_build_menu('moderation', group_id))
     
     @staticmethod
-    def toggle_menu(group_id: int, item_type: str, item_name: str) -> telebot_types.InlineKeyboardMarkup:
+    def toggle_menu(group_id: int, item_type: str, item_name: str) -> Dict[str, Any]:
         """Toggle menu for items"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
+        suffix = f":{item_type}:{item_name}:{group_id}"
         buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Enable",
-                callback_data=f"toggle:enable:{item_type}:{item_name}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Disable",
-                callback_data=f"toggle:disable:{item_type}:{item_name}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"group_admin:{item_type}:{group_id}"
-            )
+            {'text': "✅ Enable", 'callback_data': "toggle:enable" + suffix},
+            {'text': "❌ Disable", 'callback_data': "toggle:disable" + suffix},
+            {'text': "🔙 Back", 'callback_data': f"group_admin:{item_type}:{group_id}"}
         ]
         
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_pack(buttons))
     
     @staticmethod
-    def confirmation_menu(action: str, group_id: int, item: str = "") -> telebot_types.InlineKeyboardMarkup:
+    def confirmation_menu(action: str, group_id: int, item: str = "") -> Dict[str, Any]:
         """Confirmation menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
         if item:
             callback_data = f"confirm:{action}:{item}:{group_id}"
         else:
             callback_data = f"confirm:{action}:{group_id}"
         
         buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Yes",
-                callback_data=f"{callback_data}:yes"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ No",
-                callback_data=f"{callback_data}:no"
-            )
+            {'text': "✅ Yes", 'callback_data': callback_data + ":yes"},
+            {'text': "❌ No", 'callback_data': callback_data + ":no"}
         ]
         
-        keyboard.row(buttons[0], buttons[1])
-        return keyboard
\ No newline at end of file
+        return _layout(_pack(buttons))
\ No newline at end of file
@@ -5,38 +5,37 @@ Blue Rose Bot - Main Menu Keyboard
 Main menu keyboard generator
 """
 
-import telebot.types as types
+from typing import Dict, Any
+
+def _build_main_menu():
+    """Build the main menu rows"""
+    buttons = [
+        {'text': "🏠 Home", 'callback_data': "menu_home"},
+        {'text': "⚙️ Settings", 'callback_data': "menu_settings"},
+        {'text': "📊 Stats", 'callback_data': "menu_stats"},
+        {'text': "🛡️ Moderation", 'callback_data': "menu_moderation"},
+        {'text': "📅 Schedule", 'callback_data': "menu_schedule"},
+        {'text': "🕌 Prayer Times", 'callback_data': "menu_prayer"},
+        {'text': "💰 Payments", 'callback_data': "menu_payments"},
+        {'text': "📞 Support", 'callback_data': "menu_support"},
+        {'text': "📝 Feedback", 'callback_data': "menu_feedback"},
+        {'text': "🔔 Notifications", 'callback_data': "menu_notifications"},
+        {'text': "📋 Templates", 'callback_data': "menu_templates"},
+        {'text': "🤖 Auto-replies", 'callback_data': "menu_auto_reply"},
+        {'text': "🔓 Unlock Features", 'callback_data': "menu_unlock_features"},
+        {'text': "🔙 Back", 'callback_data': "main_menu_back"}
+    ]
+    
+    # Add buttons in rows of 2; tuples keep the shared rows immutable
+    return tuple(tuple(buttons[i:i + 2]) for i in range(0, len(buttons), 2))
+
+# The main menu has no parameters; build its rows once and share them
+_MAIN_MENU_ROWS = _build_main_menu()
 
 class MainMenuKeyboard:
     """Main Menu Keyboard Generator"""
     
     @staticmethod
-    def get_main_menu() -> types.InlineKeyboardMarkup:
+    def get_main_menu() -> Dict[str, Any]:
         """Get main menu keyboard"""
-        keyboard = types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            types.InlineKeyboardButton("🏠 Home", callback_data="menu_home"),
-            types.InlineKeyboardButton("⚙️ Settings", callback_data="menu_settings"),
-            types.InlineKeyboardButton("📊 Stats", callback_data="menu_stats"),
-            types.InlineKeyboardButton("🛡️ Moderation", callback_data="menu_moderation"),
-            types.InlineKeyboardButton("📅 Schedule", callback_data="menu_schedule"),
-            types.InlineKeyboardButton("🕌 Prayer Times", callback_data="menu_prayer"),
-            types.InlineKeyboardButton("💰 Payments", callback_data="menu_payments"),
-            types.InlineKeyboardButton("📞 Support", callback_data="menu_support"),
-            types.InlineKeyboardButton("📝 Feedback", callback_data="menu_feedback"),
-            types.InlineKeyboardButton("🔔 Notifications", callback_data="menu_notifications"),
-            types.InlineKeyboardButton("📋 Templates", callback_data="menu_templates"),
-            types.InlineKeyboardButton("🤖 Auto-replies", callback_data="menu_auto_reply"),
-            types.InlineKeyboardButton("🔓 Unlock Features", callback_data="menu_unlock_features"),
-            types.InlineKeyboardButton("🔙 Back", callback_data="main_menu_back")
-        ]
-        
-        # Add buttons in rows of 2
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return {'inline_keyboard': _MAIN_MENU_ROWS}
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - Keyboard Markup Helpers
+Conversion between dict layouts and telebot markups
+"""
+
+from typing import Dict, Any
+
+def to_markup(keyboard: Dict[str, Any]):
+    """Convert an inline_keyboard dict layout into a typed telebot markup"""
+    # Imported here so the layout modules load without telebot installed
+    from telebot.types import InlineKeyboardMarkup
+    
+    return InlineKeyboardMarkup.de_json(keyboard)
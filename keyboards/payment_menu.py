@@ -5,280 +5,141 @@ Blue Rose Bot - Payment Menu Keyboard
 Payment and plan management keyboard layouts
 """
 
-from typing import List, Dict, Any
-import telebot.types as telebot_types
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+Rows = Tuple[Tuple[Dict[str, str], ...], ...]
+
+def _pack(buttons: List[Dict[str, str]]) -> Rows:
+    """Lay buttons out two per row as immutable rows"""
+    return tuple(tuple(buttons[i:i + 2]) for i in range(0, len(buttons), 2))
+
+def _layout(rows: Rows) -> Dict[str, Any]:
+    """Wrap shared rows in a fresh inline_keyboard dict"""
+    return {'inline_keyboard': rows}
+
+# The main menu has no parameters; its rows are built once at import
+_MAIN_MENU_ROWS = _pack([
+    {'text': "💳 Request Plan", 'callback_data': "payment:request_plan"},
+    {'text': "📋 My Plans", 'callback_data': "payment:my_plans"},
+    {'text': "⏰ Expiry Status", 'callback_data': "payment:expiry_status"},
+    {'text': "📊 Payment History", 'callback_data': "payment:history"},
+    {'text': "🔄 Renew Plan", 'callback_data': "payment:renew"},
+    {'text': "❌ Cancel Plan", 'callback_data': "payment:cancel"},
+    {'text': "🆘 Payment Help", 'callback_data': "payment:help"},
+    {'text': "🔙 Back", 'callback_data': "main_menu"}
+])
+
+# Parameterized menus repeat for the same few groups and requests, so their
+# rows are cached per argument set
+@lru_cache(maxsize=512)
+def _plan_selection_rows(group_id: int) -> Rows:
+    gid = str(group_id)
+    return _pack([
+        {'text': "🆓 Free Trial (30 Days)", 'callback_data': "payment:select:free:" + gid},
+        {'text': "💰 Basic (30 Days - 60৳)", 'callback_data': "payment:select:basic:" + gid},
+        {'text': "💎 Standard (90 Days - 100৳)", 'callback_data': "payment:select:standard:" + gid},
+        {'text': "👑 Premium (8 Months - 200৳)", 'callback_data': "payment:select:premium:" + gid},
+        {'text': "🔙 Back", 'callback_data': "payment:main"}
+    ])
+
+@lru_cache(maxsize=512)
+def _payment_methods_rows(plan_type: str, group_id: int) -> Rows:
+    gid = str(group_id)
+    suffix = f":{plan_type}:{group_id}"
+    return _pack([
+        {'text': "📱 bKash", 'callback_data': "payment:method:bkash" + suffix},
+        {'text': "📱 Nagad", 'callback_data': "payment:method:nagad" + suffix},
+        {'text': "🏦 Bank Transfer", 'callback_data': "payment:method:bank" + suffix},
+        {'text': "💳 Other", 'callback_data': "payment:method:other" + suffix},
+        {'text': "🔙 Back", 'callback_data': "payment:select:" + gid}
+    ])
+
+@lru_cache(maxsize=512)
+def _payment_confirmation_rows(plan_type: str, method: str, group_id: int) -> Rows:
+    gid = str(group_id)
+    return _pack([
+        {'text': "✅ Confirm Payment", 'callback_data': f"payment:confirm:{plan_type}:{method}:{group_id}"},
+        {'text': "❌ Cancel", 'callback_data': "payment:cancel_request:" + gid},
+        {'text': "🔄 Change Method", 'callback_data': f"payment:change_method:{plan_type}:{group_id}"},
+        {'text': "🔙 Back", 'callback_data': f"payment:method:{plan_type}:{group_id}"}
+    ])
+
+@lru_cache(maxsize=512)
+def _admin_approval_rows(request_id: str) -> Rows:
+    rid = str(request_id)
+    return _pack([
+        {'text': "✅ Approve (30 Days)", 'callback_data': "admin:approve:basic:" + rid},
+        {'text': "✅ Approve (90 Days)", 'callback_data': "admin:approve:standard:" + rid},
+        {'text': "✅ Approve (8 Months)", 'callback_data': "admin:approve:premium:" + rid},
+        {'text': "❌ Reject", 'callback_data': "admin:reject:" + rid},
+        {'text': "📋 View Details", 'callback_data': "admin:details:" + rid},
+        {'text': "👤 Contact User", 'callback_data': "admin:contact:" + rid}
+    ])
+
+@lru_cache(maxsize=512)
+def _plan_management_rows(group_id: int) -> Rows:
+    gid = str(group_id)
+    return _pack([
+        {'text': "🔄 Renew Plan", 'callback_data': "plan:renew:" + gid},
+        {'text': "📊 Upgrade Plan", 'callback_data': "plan:upgrade:" + gid},
+        {'text': "📉 Downgrade Plan", 'callback_data': "plan:downgrade:" + gid},
+        {'text': "❌ Cancel Plan", 'callback_data': "plan:cancel:" + gid},
+        {'text': "⏰ Extend Trial", 'callback_data': "plan:extend_trial:" + gid},
+        {'text': "📋 Plan Details", 'callback_data': "plan:details:" + gid},
+        {'text': "🔙 Back", 'callback_data': "payment:main"}
+    ])
+
+@lru_cache(maxsize=512)
+def _expiry_alerts_rows(group_id: int) -> Rows:
+    gid = str(group_id)
+    return _pack([
+        {'text': "🔔 Enable Alerts", 'callback_data': "alert:enable:" + gid},
+        {'text': "🔕 Disable Alerts", 'callback_data': "alert:disable:" + gid},
+        {'text': "⏰ Set Reminder", 'callback_data': "alert:reminder:" + gid},
+        {'text': "📋 Alert Settings", 'callback_data': "alert:settings:" + gid},
+        {'text': "🔙 Back", 'callback_data': "payment:main"}
+    ])
 
 class PaymentMenu:
-    """Payment Menu Keyboard"""
+    """Payment Menu Keyboard
+    
+    Menus are inline_keyboard dicts whose rows are tuples; the rows are
+    shared between requests, so each call gets its own outer dict and a
+    caller cannot append to a layout another request will see.
+    """
     
     @staticmethod
-    def main_menu() -> telebot_types.InlineKeyboardMarkup:
+    def main_menu() -> Dict[str, Any]:
         """Main payment menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "💳 Request Plan",
-                callback_data="payment:request_plan"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 My Plans",
-                callback_data="payment:my_plans"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Expiry Status",
-                callback_data="payment:expiry_status"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📊 Payment History",
-                callback_data="payment:history"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Renew Plan",
-                callback_data="payment:renew"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Cancel Plan",
-                callback_data="payment:cancel"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🆘 Payment Help",
-                callback_data="payment:help"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data="main_menu"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_MAIN_MENU_ROWS)
     
     @staticmethod
-    def plan_selection(group_id: int = 0) -> telebot_types.InlineKeyboardMarkup:
+    def plan_selection(group_id: int = 0) -> Dict[str, Any]:
         """Plan selection menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "🆓 Free Trial (30 Days)",
-                callback_data=f"payment:select:free:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "💰 Basic (30 Days - 60৳)",
-                callback_data=f"payment:select:basic:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "💎 Standard (90 Days - 100৳)",
-                callback_data=f"payment:select:standard:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "👑 Premium (8 Months - 200৳)",
-                callback_data=f"payment:select:premium:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data="payment:main"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_plan_selection_rows(group_id))
     
     @staticmethod
-    def payment_methods(plan_type: str, group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def payment_methods(plan_type: str, group_id: int) -> Dict[str, Any]:
         """Payment methods menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "📱 bKash",
-                callback_data=f"payment:method:bkash:{plan_type}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📱 Nagad",
-                callback_data=f"payment:method:nagad:{plan_type}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🏦 Bank Transfer",
-                callback_data=f"payment:method:bank:{plan_type}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "💳 Other",
-                callback_data=f"payment:method:other:{plan_type}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"payment:select:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_payment_methods_rows(plan_type, group_id))
     
     @staticmethod
-    def payment_confirmation(plan_type: str, method: str, group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def payment_confirmation(plan_type: str, method: str, group_id: int) -> Dict[str, Any]:
         """Payment confirmation menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Confirm Payment",
-                callback_data=f"payment:confirm:{plan_type}:{method}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Cancel",
-                callback_data=f"payment:cancel_request:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔄 Change Method",
-                callback_data=f"payment:change_method:{plan_type}:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data=f"payment:method:{plan_type}:{group_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_payment_confirmation_rows(plan_type, method, group_id))
     
     @staticmethod
-    def admin_approval_menu(request_id: str) -> telebot_types.InlineKeyboardMarkup:
+    def admin_approval_menu(request_id: str) -> Dict[str, Any]:
         """Admin approval menu for payments"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "✅ Approve (30 Days)",
-                callback_data=f"admin:approve:basic:{request_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "✅ Approve (90 Days)",
-                callback_data=f"admin:approve:standard:{request_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "✅ Approve (8 Months)",
-                callback_data=f"admin:approve:premium:{request_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Reject",
-                callback_data=f"admin:reject:{request_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 View Details",
-                callback_data=f"admin:details:{request_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "👤 Contact User",
-                callback_data=f"admin:contact:{request_id}"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_admin_approval_rows(request_id))
     
     @staticmethod
-    def plan_management(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def plan_management(group_id: int) -> Dict[str, Any]:
         """Plan management menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "🔄 Renew Plan",
-                callback_data=f"plan:renew:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📊 Upgrade Plan",
-                callback_data=f"plan:upgrade:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📉 Downgrade Plan",
-                callback_data=f"plan:downgrade:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "❌ Cancel Plan",
-                callback_data=f"plan:cancel:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Extend Trial",
-                callback_data=f"plan:extend_trial:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Plan Details",
-                callback_data=f"plan:details:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data="payment:main"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+        return _layout(_plan_management_rows(group_id))
     
     @staticmethod
-    def expiry_alerts_menu(group_id: int) -> telebot_types.InlineKeyboardMarkup:
+    def expiry_alerts_menu(group_id: int) -> Dict[str, Any]:
         """Expiry alerts menu"""
-        keyboard = telebot_types.InlineKeyboardMarkup(row_width=2)
-        
-        buttons = [
-            telebot_types.InlineKeyboardButton(
-                "🔔 Enable Alerts",
-                callback_data=f"alert:enable:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔕 Disable Alerts",
-                callback_data=f"alert:disable:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "⏰ Set Reminder",
-                callback_data=f"alert:reminder:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "📋 Alert Settings",
-                callback_data=f"alert:settings:{group_id}"
-            ),
-            telebot_types.InlineKeyboardButton(
-                "🔙 Back",
-                callback_data="payment:main"
-            )
-        ]
-        
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
\ No newline at end of file
+        return _layout(_expiry_alerts_rows(group_id))
\ No newline at end of file
@@ -7,76 +7,69 @@ Start menu keyboard generator
 
 import logging
 from typing import Dict, Any, Optional
-import telebot.types as types
 
 from config import Config
-from storage.json_engine import JSONEngine
+from core.permission_engine import PermissionEngine
+from storage.json_cache import admin_ids
 
 logger = logging.getLogger(__name__)
 
+def _build_keyboard(*pairs):
+    """Build two-per-row immutable rows from (label, callback_data) pairs"""
+    buttons = [{'text': label, 'callback_data': callback_data} for label, callback_data in pairs]
+    return tuple(tuple(buttons[i:i + 2]) for i in range(0, len(buttons), 2))
+
+_ADD_GROUP = ("📦 Add to Group", "start_add_group")
+_ALL_GROUPS = ("📋 All Groups", "start_all_groups")
+_PLAN = ("💰 Plan", "start_plan")
+_HELP = ("🆘 Help", "start_help")
+_SUPPORT = ("📞 Support", "start_support")
+_MASTER = ("👑 Master", "start_master")
+_ADMIN_PANEL = ("👑 Admin Panel", "start_admin")
+_BOT_INFO = ("🤖 Bot Info", "start_bot_info")
+_END = ("❌ End", "start_end")
+_GROUP_SETTINGS = ("⚙️ Group Settings", "start_group_settings")
+
+# Start menus only vary by role, so every variant's rows are built once at
+# import and shared; rows are tuples, and each call gets its own outer dict
+_PRIVATE_USER_ROWS = _build_keyboard(
+    _ADD_GROUP, _ALL_GROUPS, _PLAN, _HELP, _SUPPORT, _MASTER, _BOT_INFO, _END
+)
+_PRIVATE_ADMIN_ROWS = _build_keyboard(
+    _ADD_GROUP, _ALL_GROUPS, _PLAN, _HELP, _SUPPORT, _MASTER, _ADMIN_PANEL, _BOT_INFO, _END
+)
+_GROUP_MEMBER_ROWS = _build_keyboard(_HELP, _SUPPORT, _BOT_INFO, _END)
+_GROUP_ADMIN_ROWS = _build_keyboard(_GROUP_SETTINGS, _HELP, _SUPPORT, _BOT_INFO, _END)
+
 class StartKeyboard:
     """Start Menu Keyboard Generator"""
     
+    __slots__ = ('config', 'permission_engine')
+    
     def __init__(self):
         self.config = Config
+        self.permission_engine = PermissionEngine()
+    
+    def is_bot_admin(self, user_id: int) -> bool:
+        """Check bot admin membership against the cached admin set"""
+        # Rebuilt only when bot_admins.json changes
+        return user_id in admin_ids(self.config.JSON_PATHS['bot_admins'])
     
-    async def get_private_keyboard(self, user_id: int, role) -> types.InlineKeyboardMarkup:
+    def get_private_keyboard(self, user_id: int, role) -> Dict[str, Any]:
         """Get keyboard for private chat"""
         is_owner = user_id == self.config.BOT_OWNER_ID
-        bot_admins = JSONEngine.load_json(self.config.JSON_PATHS['bot_admins'], {})
-        is_admin = user_id in bot_admins.get('admins', [])
+        is_admin = self.is_bot_admin(user_id)
 
-        keyboard = types.InlineKeyboardMarkup(row_width=2)
-        buttons = [
-            types.InlineKeyboardButton("📦 Add to Group", callback_data="start_add_group"),
-            types.InlineKeyboardButton("📋 All Groups", callback_data="start_all_groups"),
-            types.InlineKeyboardButton("💰 Plan", callback_data="start_plan"),
-            types.InlineKeyboardButton("🆘 Help", callback_data="start_help"),
-            types.InlineKeyboardButton("📞 Support", callback_data="start_support"),
-            types.InlineKeyboardButton("👑 Master", callback_data="start_master"),
-            types.InlineKeyboardButton("🤖 Bot Info", callback_data="start_bot_info"),
-            types.InlineKeyboardButton("❌ End", callback_data="start_end"),
-        ]
-
-        # Add admin button if user is owner/admin
         if is_owner or is_admin:
-            buttons.insert(6, types.InlineKeyboardButton("👑 Admin Panel", callback_data="start_admin"))
-
-        # Add buttons to keyboard in rows of 2
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+            return {'inline_keyboard': _PRIVATE_ADMIN_ROWS}
+        return {'inline_keyboard': _PRIVATE_USER_ROWS}
     
-    async def get_group_keyboard(self, user_id: int, role, chat_id: int) -> types.InlineKeyboardMarkup:
+    async def get_group_keyboard(self, user_id: int, role, chat_id: int) -> Dict[str, Any]:
         """Get keyboard for group chat"""
-        from core.permission_engine import PermissionEngine
-        permission_engine = PermissionEngine()
-        is_group_admin = await permission_engine.can_perform_action(
+        is_group_admin = await self.permission_engine.can_perform_action(
             user_id, 'access_group_panel', chat_id
         )
 
-        keyboard = types.InlineKeyboardMarkup(row_width=2)
-        buttons = [
-            types.InlineKeyboardButton("🆘 Help", callback_data="start_help"),
-            types.InlineKeyboardButton("📞 Support", callback_data="start_support"),
-            types.InlineKeyboardButton("🤖 Bot Info", callback_data="start_bot_info"),
-            types.InlineKeyboardButton("❌ End", callback_data="start_end"),
-        ]
-
-        # Add settings button if user is group admin
         if is_group_admin:
-            buttons.insert(0, types.InlineKeyboardButton("⚙️ Group Settings", callback_data="start_group_settings"))
-
-        # Add buttons to keyboard in rows of 2
-        keyboard_rows = []
-        for i in range(0, len(buttons), 2):
-            if i + 1 < len(buttons):
-                keyboard.row(buttons[i], buttons[i + 1])
-            else:
-                keyboard.row(buttons[i])
-        
-        return keyboard
+            return {'inline_keyboard': _GROUP_ADMIN_ROWS}
+        return {'inline_keyboard': _GROUP_MEMBER_ROWS}
@@ -6,8 +6,12 @@ Telegram Bot with Advanced Features
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -24,16 +28,24 @@ from telegram_bot import TelegramBot
 from analytics.system_health import SystemHealthMonitor
 from payments.expiry_alert import ExpiryAlert
 from intelligence.memory_decay import MemoryDecay
+from storage.write_cache import write_cache
 
-# Configure logging
+# Configure logging: records are formatted by the QueueHandler and written
+# by a listener thread, so file and console I/O never block the event loop
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=getattr(logging, Config.LOGGING['level']),
     format=Config.LOGGING['format'],
-    handlers=[
-        logging.FileHandler(Config.LOGGING['file'], encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(Config.LOGGING['file'], encoding='utf-8'),
+    logging.StreamHandler(sys.stdout),
+    respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +66,8 @@ class BlueRoseBot:
         
         self.is_running = False
         self.start_time = None
+        self.monitor_task = None
+        self.stop_event = None
         
         # Register crash handler
         self.crash_handler.register_bot(self)
@@ -76,22 +90,25 @@ class BlueRoseBot:
                 logger.error("Boot sequence failed!")
                 return False
             
-            # Initialize kernel
-            if not await self.kernel.initialize():
+            # Kernel and event loop setup are independent of each other
+            kernel_ok, event_loop_ok = await asyncio.gather(
+                self.kernel.initialize(),
+                self.event_loop.initialize(),
+            )
+            if not kernel_ok:
                 logger.error("Kernel initialization failed!")
                 return False
-            
-            # Initialize event loop
-            if not await self.event_loop.initialize():
+            if not event_loop_ok:
                 logger.error("Event loop initialization failed!")
                 return False
             
-            # Initialize system monitor
-            await self.system_monitor.start()
-            
             # Schedule background tasks
             await self._schedule_background_tasks()
             
+            # Start system monitor; its loop runs until stop(), so it must
+            # not be awaited inline
+            self.monitor_task = asyncio.create_task(self.system_monitor.start())
+            
             logger.info("✅ Initialization complete!")
             return True
             
@@ -102,14 +119,14 @@ class BlueRoseBot:
     
     async def _schedule_background_tasks(self):
         """Schedule background maintenance tasks"""
-        # Schedule expiry checks
-        await self.expiry_alert.schedule_expiry_checks(interval_hours=6)
-        
-        # Schedule memory decay
-        await self.memory_decay.schedule_regular_decay(interval_hours=24)
-        
-        # Schedule system health monitoring
-        await self.system_monitor.schedule_health_checks(interval_minutes=5)
+        # Expiry checks, memory decay, health monitoring and JSON cache
+        # flushes are independent
+        await asyncio.gather(
+            self.expiry_alert.schedule_expiry_checks(interval_hours=6),
+            self.memory_decay.schedule_regular_decay(interval_hours=24),
+            self.system_monitor.schedule_health_checks(interval_minutes=5),
+            write_cache.schedule_flushes(interval_seconds=2),
+        )
         
         logger.info("✅ Background tasks scheduled")
     
@@ -126,7 +143,7 @@ class BlueRoseBot:
                 return
             
             self.is_running = True
-            self.start_time = asyncio.get_event_loop().time()
+            self.start_time = time.monotonic()
             
             # Start kernel
             await self.kernel.start()
@@ -175,7 +192,8 @@ class BlueRoseBot:
                 return
             
             self.is_running = True
-            self.start_time = asyncio.get_event_loop().time()
+            self.start_time = time.monotonic()
+            self.stop_event = asyncio.Event()
             
             # Start kernel
             await self.kernel.start()
@@ -188,9 +206,8 @@ class BlueRoseBot:
             # Set webhook
             await self.telegram_bot.set_webhook(webhook_url, secret_token)
             
-            # Keep the bot running
-            while self.is_running:
-                await asyncio.sleep(1)
+            # Keep the bot running until shutdown() signals the event
+            await self.stop_event.wait()
             
         except KeyboardInterrupt:
             logger.info("🛑 Received shutdown signal...")
@@ -207,6 +224,8 @@ class BlueRoseBot:
         
         logger.info("🔴 Shutting down Blue Rose Bot...")
         self.is_running = False
+        if self.stop_event:
+            self.stop_event.set()
         
         try:
             # Stop system monitor
@@ -5,14 +5,19 @@ Blue Rose Bot - Anti Bot
 Detect and handle bot accounts
 """
 
+import re
 import logging
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+_HAS_DIGIT = re.compile(r'\d').search
+
 class AntiBot:
     """Anti-Bot Detection System"""
     
+    __slots__ = ()
+    
     async def check_bot(self, user: Dict[str, Any]) -> Dict[str, Any]:
         """Check if user is a bot"""
         is_bot = user.get('is_bot', False)
@@ -28,6 +33,6 @@ class AntiBot:
         """Detect bot-like behavior"""
         # Simple heuristic
         first_name = user.get('first_name', '')
-        if first_name and any(char.isdigit() for char in first_name):
+        if first_name and _HAS_DIGIT(first_name):
             return 'suspicious_name'
         return 'normal'
\ No newline at end of file
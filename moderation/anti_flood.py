@@ -7,22 +7,30 @@ Prevent message flooding
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict, deque
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 class AntiFlood:
     """Anti-Flood Protection System"""
     
+    __slots__ = ('user_state', 'capacity', 'thresholds', 'history_size', 'idle_timeout')
+    
     def __init__(self):
-        self.message_times = {}
-        self.flood_detections = {}
+        # (chat_id, user_id) -> [message times, flood detections], kept in
+        # least-recently-active order so idle users are evicted from the front
+        self.user_state = OrderedDict()
+        self.capacity = 10000
         self.thresholds = {
             'messages_per_second': 5,
             'messages_per_minute': 20,
             'identical_messages_per_minute': 3,
         }
+        # Only the last minute matters, so per-user history is bounded
+        self.history_size = self.thresholds['messages_per_minute'] + 5
+        self.idle_timeout = 300  # seconds before an idle user is forgotten
     
     async def check_flood(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Check for message flooding"""
@@ -32,36 +40,55 @@ class AntiFlood:
         if not chat_id or not user_id:
             return {'is_flood': False}
         
-        user_key = f"{chat_id}_{user_id}"
-        current_time = datetime.now()
+        user_key = (chat_id, user_id)
+        now = time.monotonic()
+        
+        self._evict_idle(now)
         
         # Initialize tracking
-        if user_key not in self.message_times:
-            self.message_times[user_key] = []
-            self.flood_detections[user_key] = 0
+        state = self.user_state.get(user_key)
+        if state is None:
+            state = self.user_state[user_key] = [deque(maxlen=self.history_size), 0]
+            if len(self.user_state) > self.capacity:
+                self.user_state.popitem(last=False)
+        else:
+            self.user_state.move_to_end(user_key)
+        times = state[0]
         
-        # Add current message time
-        self.message_times[user_key].append(current_time)
+        # Add current message time and drop anything older than a minute
+        times.append(now)
+        one_minute_ago = now - 60.0
+        while times[0] <= one_minute_ago:
+            times.popleft()
         
-        # Check flooding
+        # Check flooding; neither window can exceed the number of messages
+        # seen in the last minute, so short histories skip the scans
         flood_reasons = []
+        recent_minute = len(times)
+        # A full history may have dropped messages from this minute, so its
+        # counts are lower bounds
+        at_least = "at least " if recent_minute == times.maxlen else ""
         
         # Check per-second rate
-        one_second_ago = current_time - timedelta(seconds=1)
-        recent_second = [t for t in self.message_times[user_key] if t > one_second_ago]
-        if len(recent_second) > self.thresholds['messages_per_second']:
-            flood_reasons.append(f"High per-second rate: {len(recent_second)} messages")
+        if recent_minute > self.thresholds['messages_per_second']:
+            one_second_ago = now - 1.0
+            recent_second = 0
+            for t in reversed(times):
+                if t <= one_second_ago:
+                    break
+                recent_second += 1
+            if recent_second > self.thresholds['messages_per_second']:
+                prefix = at_least if recent_second == recent_minute else ""
+                flood_reasons.append(f"High per-second rate: {prefix}{recent_second} messages")
         
         # Check per-minute rate
-        one_minute_ago = current_time - timedelta(minutes=1)
-        recent_minute = [t for t in self.message_times[user_key] if t > one_minute_ago]
-        if len(recent_minute) > self.thresholds['messages_per_minute']:
-            flood_reasons.append(f"High per-minute rate: {len(recent_minute)} messages")
+        if recent_minute > self.thresholds['messages_per_minute']:
+            flood_reasons.append(f"High per-minute rate: {at_least}{recent_minute} messages")
         
         is_flood = len(flood_reasons) > 0
         
         if is_flood:
-            self.flood_detections[user_key] += 1
+            state[1] += 1
             logger.warning(f"Flood detected: user {user_id} in chat {chat_id}")
         
         return {
@@ -69,4 +96,11 @@ class AntiFlood:
             'reasons': flood_reasons,
             'user_id': user_id,
             'chat_id': chat_id,
-        }
\ No newline at end of file
+        }
+    
+    def _evict_idle(self, now: float):
+        """Forget users who have not posted within the idle timeout"""
+        cutoff = now - self.idle_timeout
+        user_state = self.user_state
+        while user_state and next(iter(user_state.values()))[0][-1] < cutoff:
+            user_state.popitem(last=False)
\ No newline at end of file
@@ -10,16 +10,25 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Shared result for groups that do not block forwards; callers only read it
+_NOT_BLOCKED = {'is_forwarded': False, 'forward_source': None, 'should_block': False}
+
 class AntiForward:
     """Anti-Forward Protection System"""
     
-    async def check_forward(self, message: Dict[str, Any],
-                          group_settings: Dict[str, Any]) -> Dict[str, Any]:
+    __slots__ = ()
+    
+    def check_forward(self, message: Dict[str, Any],
+                      group_settings: Dict[str, Any]) -> Dict[str, Any]:
         """Check if message is forwarded"""
+        if not group_settings.get('block_forwards', False):
+            return _NOT_BLOCKED
+        
+        forward_source = message.get('forward_from') or message.get('forward_from_chat')
         is_forwarded = 'forward_from' in message or 'forward_from_chat' in message
         
         return {
             'is_forwarded': is_forwarded,
-            'forward_source': message.get('forward_from') or message.get('forward_from_chat'),
-            'should_block': is_forwarded and group_settings.get('block_forwards', False),
+            'forward_source': forward_source,
+            'should_block': is_forwarded,
         }
\ No newline at end of file
@@ -8,41 +8,66 @@ Control link sharing in groups
 import re
 import logging
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# Sentence punctuation that the URL pattern picks up after a link
+_TRAILING_PUNCTUATION = '.,;:!?)]'
+
+# Shared result for link-free messages; callers only read it
+_NO_LINKS = {'has_links': False}
+
 class AntiLink:
     """Anti-Link Protection System"""
     
+    __slots__ = ('allowed_domains', 'url_pattern', '_url_re', '_allowed', '_allowed_suffixes')
+    
     def __init__(self):
         self.allowed_domains = [
             'telegram.org', 'github.com', 'wikipedia.org',
             'youtube.com', 'google.com', 'stackoverflow.com',
         ]
         self.url_pattern = r'https?://\S+|www\.\S+'
+        self._url_re = re.compile(self.url_pattern)
+        self._allowed = frozenset(self.allowed_domains)
+        self._allowed_suffixes = tuple('.' + domain for domain in self.allowed_domains)
     
     async def check_links(self, message: Dict[str, Any], 
                          group_settings: Dict[str, Any]) -> Dict[str, Any]:
         """Check for links in message"""
         text = message.get('text', '')
         if not text:
-            return {'has_links': False}
+            return _NO_LINKS
         
         # Find all URLs
-        urls = re.findall(self.url_pattern, text)
+        urls = self._url_re.findall(text)
         
         if not urls:
-            return {'has_links': False}
+            return _NO_LINKS
         
         # Check against allowed domains
         blocked_urls = []
+        allowed_urls = []
         for url in urls:
-            if not any(domain in url for domain in self.allowed_domains):
+            if self._is_allowed(url):
+                allowed_urls.append(url)
+            else:
                 blocked_urls.append(url)
         
         return {
             'has_links': True,
             'total_urls': len(urls),
             'blocked_urls': blocked_urls,
-            'allowed_urls': [url for url in urls if url not in blocked_urls],
-        }
\ No newline at end of file
+            'allowed_urls': allowed_urls,
+        }
+    
+    def _is_allowed(self, url: str) -> bool:
+        """Check whether a URL's host is an allowed domain or a subdomain of one"""
+        url = url.rstrip(_TRAILING_PUNCTUATION)
+        try:
+            host = urlsplit(url if '://' in url else 'http://' + url).hostname or ''
+        except ValueError:
+            return False
+        host = host.rstrip('.')
+        return host in self._allowed or host.endswith(self._allowed_suffixes)
\ No newline at end of file
@@ -6,25 +6,119 @@ Detect and prevent spam messages
 """
 
 import asyncio
+import json
 import logging
+import os
 import re
-from typing import Dict, Any, List, Optional, Set
-from datetime import datetime, timedelta
+import string
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, Any, List, Optional, Set, Tuple
+from datetime import datetime
 
 from config import Config
-from storage.json_engine import JSONEngine
 
 logger = logging.getLogger(__name__)
 
+# Characters that make a spam keyword a regex rather than a plain substring
+_REGEX_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+
+_DROP_ASCII_UPPER = str.maketrans('', '', string.ascii_uppercase)
+
+# Score at which the strongest action (a ban) is taken; checks that only
+# add to the score are skipped once it is reached
+_BAN_SCORE = 80
+
+# Spam log entries kept after compaction, and appends between compactions
+_SPAM_LOG_MAX_ENTRIES = 1000
+_SPAM_LOG_COMPACT_EVERY = 100
+
+_SPAM_PATTERNS = {
+    'common_spam_keywords': [
+        # English
+        'buy now', 'click here', 'free money', 'make money',
+        'work from home', 'earn cash', 'get rich', 'lottery',
+        'prize winner', 'congratulations', 'you won', 'limited time',
+        'special offer', 'discount', 'sale', 'promotion',
+        'investment', 'bitcoin', 'crypto', 'trading',
+        'follow me', 'subscribe', 'like and share',
+        
+        # Bangla
+        'কিনুন এখন', 'ফ্রি মানি', 'টাকা উপার্জন',
+        'বিনিয়োগ', 'বিটকয়েন', 'ক্রিপ্টো',
+        'অফার', 'ডিসকাউন্ট', 'সেল', 'প্রমোশন',
+        'লটারি', 'প্রাইজ', 'অভিনন্দন', 'জিতেছেন',
+        'সাবস্ক্রাইব', 'লাইক শেয়ার', 'ফলো মি',
+        
+        # URLs and mentions
+        r'http://', r'https://', r'www\.', r'\.com',
+        r'@\w+', r'#\w+',
+    ],
+    'suspicious_patterns': [
+        r'\b[A-Z]{3,}\b',  # All caps words
+        r'\!{3,}',          # Multiple exclamation marks
+        r'\?{3,}',          # Multiple question marks
+        r'\.{3,}',          # Multiple dots
+        r'[\*\-_=]{5,}',    # Repeated special characters
+    ],
+    'spam_phrases': [
+        # Too good to be true
+        '100% guaranteed', 'no risk', 'risk free',
+        'easy money', 'quick cash', 'instant profit',
+        
+        # Urgency
+        'act now', 'limited offer', 'today only',
+        'last chance', 'don\'t miss', 'hurry up',
+        
+        # Secrecy
+        'secret method', 'hidden secret', 'insider info',
+        'confidential', 'exclusive', 'private offer',
+    ],
+}
+
+def _compile_spam_patterns(spam_patterns: Dict[str, Any]) -> tuple:
+    """Precompile spam patterns for the per-message checks"""
+    # Plain keywords are matched as substrings; only real regexes go
+    # through the regex engine
+    keyword_matchers = tuple(
+        (keyword, re.compile(keyword, re.IGNORECASE).search
+         if _REGEX_CHARS.intersection(keyword) else None)
+        for keyword in spam_patterns['common_spam_keywords']
+    )
+    # Bangla keywords can never match ASCII-only text
+    ascii_keyword_matchers = tuple(
+        matcher for matcher in keyword_matchers if matcher[0].isascii()
+    )
+    suspicious_patterns = tuple(
+        (pattern, re.compile(pattern).search)
+        for pattern in spam_patterns['suspicious_patterns']
+    )
+    spam_phrases = tuple(
+        (phrase, phrase.lower())
+        for phrase in spam_patterns['spam_phrases']
+    )
+    
+    return keyword_matchers, ascii_keyword_matchers, suspicious_patterns, spam_phrases
+
+# Patterns and their matchers never change, so all instances share one copy
+_COMPILED_SPAM_PATTERNS = _compile_spam_patterns(_SPAM_PATTERNS)
+
 class AntiSpam:
     """Anti-Spam Protection System"""
     
     def __init__(self):
         self.config = Config
         self.spam_patterns = self._load_spam_patterns()
+        (self._keyword_matchers, self._ascii_keyword_matchers,
+         self._suspicious_patterns, self._spam_phrases) = _COMPILED_SPAM_PATTERNS
         self.user_message_times = {}
         self.user_message_counts = {}
         self.spam_detections = {}
+        self.user_recent_messages = {}
+        self.user_url_messages = {}
         
         # Spam detection thresholds
         self.thresholds = {
@@ -37,51 +131,19 @@ class AntiSpam:
         
         # Cleanup interval
         self.cleanup_interval = 300  # 5 minutes
+        
+        # Append-only spam log, one JSON entry per line
+        self.spam_log_file = self.config.DATA_DIR / "moderation" / "spam_logs.jsonl"
+        self._spam_log_lock = threading.Lock()
+        self._spam_log_appends = 0
+        
+        # Spam log written by older versions, imported on first use
+        self.legacy_spam_log_file = self.config.DATA_DIR / "moderation" / "spam_logs.json"
+        self._legacy_spam_log_checked = False
     
     def _load_spam_patterns(self) -> Dict[str, Any]:
         """Load spam detection patterns"""
-        return {
-            'common_spam_keywords': [
-                # English
-                'buy now', 'click here', 'free money', 'make money',
-                'work from home', 'earn cash', 'get rich', 'lottery',
-                'prize winner', 'congratulations', 'you won', 'limited time',
-                'special offer', 'discount', 'sale', 'promotion',
-                'investment', 'bitcoin', 'crypto', 'trading',
-                'follow me', 'subscribe', 'like and share',
-                
-                # Bangla
-                'কিনুন এখন', 'ফ্রি মানি', 'টাকা উপার্জন',
-                'বিনিয়োগ', 'বিটকয়েন', 'ক্রিপ্টো',
-                'অফার', 'ডিসকাউন্ট', 'সেল', 'প্রমোশন',
-                'লটারি', 'প্রাইজ', 'অভিনন্দন', 'জিতেছেন',
-                'সাবস্ক্রাইব', 'লাইক শেয়ার', 'ফলো মি',
-                
-                # URLs and mentions
-                r'http://', r'https://', r'www\.', r'\.com',
-                r'@\w+', r'#\w+',
-            ],
-            'suspicious_patterns': [
-                r'\b[A-Z]{3,}\b',  # All caps words
-                r'\!{3,}',          # Multiple exclamation marks
-                r'\?{3,}',          # Multiple question marks
-                r'\.{3,}',          # Multiple dots
-                r'[\*\-_=]{5,}',    # Repeated special characters
-            ],
-            'spam_phrases': [
-                # Too good to be true
-                '100% guaranteed', 'no risk', 'risk free',
-                'easy money', 'quick cash', 'instant profit',
-                
-                # Urgency
-                'act now', 'limited offer', 'today only',
-                'last chance', 'don\'t miss', 'hurry up',
-                
-                # Secrecy
-                'secret method', 'hidden secret', 'insider info',
-                'confidential', 'exclusive', 'private offer',
-            ],
-        }
+        return _SPAM_PATTERNS
     
     async def check_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Check if message is spam"""
@@ -94,16 +156,21 @@ class AntiSpam:
                 return {'is_spam': False, 'reasons': []}
             
             # Initialize user tracking
-            user_key = f"{chat_id}_{user_id}"
+            user_key = (chat_id, user_id)
             current_time = datetime.now()
             
             if user_key not in self.user_message_times:
-                self.user_message_times[user_key] = []
+                self.user_message_times[user_key] = deque(maxlen=256)
                 self.user_message_counts[user_key] = 0
                 self.spam_detections[user_key] = 0
             
-            # Record message time
-            self.user_message_times[user_key].append(current_time)
+            # Record message time and drop anything older than a minute
+            now = time.monotonic()
+            message_times = self.user_message_times[user_key]
+            message_times.append(now)
+            one_minute_ago = now - 60.0
+            while message_times[0] <= one_minute_ago:
+                message_times.popleft()
             self.user_message_counts[user_key] += 1
             
             # Check various spam indicators
@@ -111,34 +178,38 @@ class AntiSpam:
             spam_score = 0
             
             # 1. Check message frequency
-            freq_reason = await self._check_frequency(user_key)
+            freq_reason = self._check_frequency(user_key)
             if freq_reason:
                 spam_reasons.append(freq_reason)
                 spam_score += 30
             
-            # 2. Check spam patterns in text
             if text:
-                pattern_reasons = await self._check_patterns(text)
-                spam_reasons.extend(pattern_reasons)
-                spam_score += len(pattern_reasons) * 10
-                
-                # 3. Check for identical/similar messages
-                similarity_reason = await self._check_similarity(user_key, text)
+                # Checks that record message history always run
+                # 2. Check for identical/similar messages
+                similarity_reason = self._check_similarity(user_key, text)
                 if similarity_reason:
                     spam_reasons.append(similarity_reason)
                     spam_score += 25
                 
-                # 4. Check URL density
-                url_reason = await self._check_url_density(user_key, text)
+                # 3. Check URL density
+                url_reason = self._check_url_density(user_key, text, now)
                 if url_reason:
                     spam_reasons.append(url_reason)
                     spam_score += 20
                 
+                # 4. Check spam patterns in text, only as far as a ban
+                if spam_score < _BAN_SCORE:
+                    max_reasons = -(-(_BAN_SCORE - spam_score) // 10)
+                    pattern_reasons = self._check_patterns(text, max_reasons)
+                    spam_reasons.extend(pattern_reasons)
+                    spam_score += len(pattern_reasons) * 10
+                
                 # 5. Check caps ratio
-                caps_reason = await self._check_caps_ratio(text)
-                if caps_reason:
-                    spam_reasons.append(caps_reason)
-                    spam_score += 15
+                if spam_score < _BAN_SCORE:
+                    caps_reason = self._check_caps_ratio(text)
+                    if caps_reason:
+                        spam_reasons.append(caps_reason)
+                        spam_score += 15
             
             # Determine if spam
             is_spam = spam_score >= 50  # Threshold for spam
@@ -161,66 +232,62 @@ class AntiSpam:
             logger.error(f"Spam check failed: {e}")
             return {'is_spam': False, 'error': str(e)}
     
-    async def _check_frequency(self, user_key: str) -> Optional[str]:
+    def _check_frequency(self, user_key: Tuple[int, int]) -> Optional[str]:
         """Check message frequency"""
-        message_times = self.user_message_times.get(user_key, [])
-        
-        if len(message_times) < 2:
-            return None
+        # Message times only hold the last minute; see check_message
+        message_count = len(self.user_message_times.get(user_key, ()))
         
-        # Check messages in last minute
-        current_time = datetime.now()
-        one_minute_ago = current_time - timedelta(minutes=1)
-        
-        recent_messages = [t for t in message_times if t > one_minute_ago]
-        
-        if len(recent_messages) > self.thresholds['messages_per_minute']:
-            return f"High frequency: {len(recent_messages)} messages per minute"
+        if message_count > self.thresholds['messages_per_minute']:
+            return f"High frequency: {message_count} messages per minute"
         
         return None
     
-    async def _check_patterns(self, text: str) -> List[str]:
-        """Check for spam patterns in text"""
+    def _check_patterns(self, text: str, max_reasons: Optional[int] = None) -> List[str]:
+        """Check for spam patterns in text, stopping after max_reasons"""
         reasons = []
         text_lower = text.lower()
         
         # Check common spam keywords
-        for keyword in self.spam_patterns['common_spam_keywords']:
-            if re.search(keyword, text_lower, re.IGNORECASE):
+        if text_lower.isascii():
+            keyword_matchers = self._ascii_keyword_matchers
+        else:
+            keyword_matchers = self._keyword_matchers
+        for keyword, search in keyword_matchers:
+            if search(text_lower) if search else keyword in text_lower:
                 reasons.append(f"Contains spam keyword: {keyword}")
                 break
         
         # Check suspicious patterns
-        for pattern in self.spam_patterns['suspicious_patterns']:
-            if re.search(pattern, text):
+        for pattern, search in self._suspicious_patterns:
+            if max_reasons is not None and len(reasons) >= max_reasons:
+                return reasons
+            if search(text):
                 reasons.append(f"Suspicious pattern: {pattern}")
         
         # Check spam phrases
-        for phrase in self.spam_patterns['spam_phrases']:
-            if phrase.lower() in text_lower:
+        for phrase, phrase_lower in self._spam_phrases:
+            if max_reasons is not None and len(reasons) >= max_reasons:
+                return reasons
+            if phrase_lower in text_lower:
                 reasons.append(f"Spam phrase: {phrase}")
         
         return reasons
     
-    async def _check_similarity(self, user_key: str, text: str) -> Optional[str]:
+    def _check_similarity(self, user_key: Tuple[int, int], text: str) -> Optional[str]:
         """Check for identical or similar messages"""
         # In a real implementation, this would compare with previous messages
         # For now, use a simple approach
         
         # Store recent messages (simplified)
-        if not hasattr(self, 'user_recent_messages'):
-            self.user_recent_messages = {}
-        
         if user_key not in self.user_recent_messages:
-            self.user_recent_messages[user_key] = []
+            # Last 10 message fingerprints, plus how often each occurs
+            self.user_recent_messages[user_key] = (deque(maxlen=10), Counter())
         
-        recent_messages = self.user_recent_messages[user_key]
+        recent_messages, fingerprint_counts = self.user_recent_messages[user_key]
+        fingerprint = hash(text)
         
         # Check for identical messages
-        identical_count = 0
-        for prev_text in recent_messages:
-            if prev_text == text:
-                identical_count += 1
+        identical_count = fingerprint_counts[fingerprint]
         
         if identical_count >= self.thresholds['identical_messages']:
             return f"Identical messages sent: {identical_count + 1} times"
@@ -230,40 +297,35 @@ class AntiSpam:
         if len(recent_messages) >= self.thresholds['similar_messages']:
             return f"Multiple similar messages: {len(recent_messages) + 1}"
         
-        # Add current message to history
-        recent_messages.append(text)
-        if len(recent_messages) > 10:  # Keep only last 10 messages
-            recent_messages.pop(0)
+        # Add current message to history, forgetting the one that falls out
+        if len(recent_messages) == recent_messages.maxlen:
+            oldest = recent_messages[0]
+            fingerprint_counts[oldest] -= 1
+            if not fingerprint_counts[oldest]:
+                del fingerprint_counts[oldest]
+        recent_messages.append(fingerprint)
+        fingerprint_counts[fingerprint] += 1
         
         return None
     
-    async def _check_url_density(self, user_key: str, text: str) -> Optional[str]:
+    def _check_url_density(self, user_key: Tuple[int, int], text: str, now: float) -> Optional[str]:
         """Check URL density in messages"""
-        # Count URLs in text
-        url_pattern = r'https?://\S+|www\.\S+'
-        urls = re.findall(url_pattern, text)
-        
-        if not urls:
+        # Only whether the text contains a URL matters
+        if not _URL_RE.search(text):
             return None
         
         # Track URL messages per user
-        if not hasattr(self, 'user_url_messages'):
-            self.user_url_messages = {}
-        
         if user_key not in self.user_url_messages:
-            self.user_url_messages[user_key] = []
+            # Monotonic times of the user's recent messages with URLs
+            self.user_url_messages[user_key] = deque()
         
         url_messages = self.user_url_messages[user_key]
-        url_messages.append({
-            'text': text,
-            'timestamp': datetime.now(),
-            'url_count': len(urls),
-        })
+        url_messages.append(now)
         
         # Keep only recent messages
-        five_minutes_ago = datetime.now() - timedelta(minutes=5)
-        url_messages = [msg for msg in url_messages if msg['timestamp'] > five_minutes_ago]
-        self.user_url_messages[user_key] = url_messages
+        five_minutes_ago = now - 300.0
+        while url_messages[0] <= five_minutes_ago:
+            url_messages.popleft()
         
         # Calculate URL density
         total_messages = self.user_message_counts.get(user_key, 0)
@@ -276,7 +338,7 @@ class AntiSpam:
         
         return None
     
-    async def _check_caps_ratio(self, text: str) -> Optional[str]:
+    def _check_caps_ratio(self, text: str) -> Optional[str]:
         """Check ratio of capital letters"""
         if not text:
             return None
@@ -286,7 +348,12 @@ class AntiSpam:
         if total_chars == 0:
             return None
         
-        caps_chars = sum(1 for c in text if c.isupper())
+        # ASCII text is counted in C by deleting capitals; other text may
+        # hold non-ASCII capitals, which need str.isupper
+        if text.isascii():
+            caps_chars = total_chars - len(text.translate(_DROP_ASCII_UPPER))
+        else:
+            caps_chars = sum(map(str.isupper, text))
         caps_ratio = caps_chars / total_chars
         
         if caps_ratio > self.thresholds['caps_ratio']:
@@ -303,7 +370,7 @@ class AntiSpam:
         chat_id = spam_result.get('chat_id')
         spam_score = spam_result.get('score', 0)
         
-        user_key = f"{chat_id}_{user_id}"
+        user_key = (chat_id, user_id)
         spam_count = self.spam_detections.get(user_key, 0)
         
         actions = []
@@ -357,53 +424,124 @@ class AntiSpam:
     async def _log_spam_action(self, log_entry: Dict[str, Any]):
         """Log spam action to file"""
         try:
-            log_file = self.config.DATA_DIR / "moderation" / "spam_logs.json"
-            log_file.parent.mkdir(exist_ok=True)
+            line = json.dumps(log_entry, ensure_ascii=False) + '\n'
+            
+            # Disk writes run in a worker thread so they never stall the loop
+            await asyncio.to_thread(self._append_spam_log, line)
+            
+        except Exception as e:
+            logger.error(f"Failed to log spam action: {e}")
+    
+    def _append_spam_log(self, line: str):
+        """Append one line, compacting the log every few appends"""
+        self.spam_log_file.parent.mkdir(exist_ok=True)
+        
+        with self._spam_log_lock:
+            self._import_legacy_spam_log()
+            
+            with open(self.spam_log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+            
+            self._spam_log_appends += 1
+            compact = self._spam_log_appends >= _SPAM_LOG_COMPACT_EVERY
+            if compact:
+                self._spam_log_appends = 0
+        
+        if compact:
+            self.compact_spam_log()
+    
+    def _import_legacy_spam_log(self):
+        """Move entries from the old spam_logs.json into the line log
+        
+        Called with the spam log lock held.
+        """
+        if self._legacy_spam_log_checked:
+            return
+        self._legacy_spam_log_checked = True
+        
+        if not self.legacy_spam_log_file.exists():
+            return
+        
+        try:
+            with open(self.legacy_spam_log_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            
+            if not isinstance(entries, list):
+                entries = []
             
-            # Load existing logs
-            logs = JSONEngine.load_json(log_file, [])
+            lines = [json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries]
             
-            # Add new log entry
-            logs.append(log_entry)
+            # Old entries go before anything already in the line log
+            if self.spam_log_file.exists():
+                with open(self.spam_log_file, 'r', encoding='utf-8') as f:
+                    lines.extend(f.readlines())
             
-            # Keep only last 1000 entries
-            if len(logs) > 1000:
-                logs = logs[-1000:]
+            temp_file = self.spam_log_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines[-_SPAM_LOG_MAX_ENTRIES:])
+            os.replace(temp_file, self.spam_log_file)
             
-            # Save logs
-            JSONEngine.save_json(log_file, logs)
+            self.legacy_spam_log_file.unlink()
+            logger.info(f"Imported {len(entries)} entries from {self.legacy_spam_log_file}")
             
         except Exception as e:
-            logger.error(f"Failed to log spam action: {e}")
+            logger.error(f"Failed to import legacy spam log: {e}")
+    
+    def compact_spam_log(self, max_entries: int = _SPAM_LOG_MAX_ENTRIES) -> int:
+        """Trim the spam log to its most recent entries"""
+        try:
+            # Hold the lock so no append lands between the read and replace
+            with self._spam_log_lock:
+                self._import_legacy_spam_log()
+                
+                if not self.spam_log_file.exists():
+                    return 0
+                
+                with open(self.spam_log_file, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+                
+                if len(lines) <= max_entries:
+                    return 0
+                
+                # Rewrite atomically so readers never see a partial log
+                temp_file = self.spam_log_file.with_suffix('.tmp')
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.writelines(lines[-max_entries:])
+                os.replace(temp_file, self.spam_log_file)
+            
+            removed = len(lines) - max_entries
+            logger.debug(f"Compacted spam log: removed {removed} entries")
+            return removed
+            
+        except Exception as e:
+            logger.error(f"Failed to compact spam log: {e}")
+            return 0
     
     async def cleanup_old_data(self):
         """Cleanup old tracking data"""
         try:
-            current_time = datetime.now()
-            five_minutes_ago = current_time - timedelta(minutes=5)
+            five_minutes_ago = time.monotonic() - 300
             
-            # Cleanup message times
+            # Remove users with no messages in the last 5 minutes
             for user_key in list(self.user_message_times.keys()):
                 message_times = self.user_message_times[user_key]
-                # Keep only messages from last 5 minutes
-                filtered_times = [t for t in message_times if t > five_minutes_ago]
-                
-                if filtered_times:
-                    self.user_message_times[user_key] = filtered_times
-                else:
-                    # Remove user if no recent messages
+                if not message_times or message_times[-1] <= five_minutes_ago:
                     del self.user_message_times[user_key]
                     self.user_message_counts.pop(user_key, None)
                     self.spam_detections.pop(user_key, None)
+                    self.user_recent_messages.pop(user_key, None)
+                    self.user_url_messages.pop(user_key, None)
+            
+            await asyncio.to_thread(self.compact_spam_log)
             
             logger.debug("Cleaned up old anti-spam data")
             
         except Exception as e:
             logger.error(f"Failed to cleanup anti-spam data: {e}")
     
-    async def get_user_spam_stats(self, user_id: int, chat_id: int) -> Dict[str, Any]:
+    def get_user_spam_stats(self, user_id: int, chat_id: int) -> Dict[str, Any]:
         """Get spam statistics for a user"""
-        user_key = f"{chat_id}_{user_id}"
+        user_key = (chat_id, user_id)
         
         return {
             'user_id': user_id,
@@ -414,7 +552,7 @@ class AntiSpam:
             'is_tracked': user_key in self.user_message_times,
         }
     
-    async def get_anti_spam_stats(self) -> Dict[str, Any]:
+    def get_anti_spam_stats(self) -> Dict[str, Any]:
         """Get anti-spam system statistics"""
         return {
             'tracked_users': len(self.user_message_times),
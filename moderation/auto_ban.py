@@ -6,11 +6,12 @@ Automatic banning system
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
 from config import Config
-from storage.json_engine import JSONEngine
+from storage.write_cache import write_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +27,8 @@ class AutoBan:
                       banned_by: int = 0) -> Dict[str, Any]:
         """Ban a user"""
         try:
-            # Load existing bans
-            bans = JSONEngine.load_json(self.bans_file, {})
+            # Cached bans; written back by the periodic flush
+            bans = write_cache.get(self.bans_file, {})
             
             user_key = f"{chat_id}_{user_id}"
             
@@ -45,7 +46,7 @@ class AutoBan:
             bans[user_key] = ban_entry
             
             # Save bans
-            JSONEngine.save_json(self.bans_file, bans)
+            write_cache.mark_dirty(self.bans_file)
             
             logger.info(f"User {user_id} banned in chat {chat_id} for {duration} seconds: {reason}")
             
@@ -59,7 +60,9 @@ class AutoBan:
             logger.error(f"Failed to ban user: {e}")
             return {'success': False, 'error': str(e)}
     
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _format_duration(seconds: int) -> str:
         """Format duration in human-readable format"""
         if seconds == 0:
             return "permanent"
@@ -6,11 +6,12 @@ Automatic muting system
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
 from config import Config
-from storage.json_engine import JSONEngine
+from storage.write_cache import write_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +27,8 @@ class AutoMute:
                        muted_by: int = 0) -> Dict[str, Any]:
         """Mute a user"""
         try:
-            # Load existing mutes
-            mutes = JSONEngine.load_json(self.mutes_file, {})
+            # Cached mutes; written back by the periodic flush
+            mutes = write_cache.get(self.mutes_file, {})
             
             user_key = f"{chat_id}_{user_id}"
             
@@ -45,7 +46,7 @@ class AutoMute:
             mutes[user_key] = mute_entry
             
             # Save mutes
-            JSONEngine.save_json(self.mutes_file, mutes)
+            write_cache.mark_dirty(self.mutes_file)
             
             logger.info(f"User {user_id} muted in chat {chat_id} for {duration} seconds: {reason}")
             
@@ -59,7 +60,9 @@ class AutoMute:
             logger.error(f"Failed to mute user: {e}")
             return {'success': False, 'error': str(e)}
     
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _format_duration(seconds: int) -> str:
         """Format duration in human-readable format"""
         if seconds < 60:
             return f"{seconds} seconds"
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, Any
 
 from config import Config
-from storage.json_engine import JSONEngine
+from storage.write_cache import write_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +24,8 @@ class AutoWarn:
                           reason: str, warned_by: int = 0) -> Dict[str, Any]:
         """Issue a warning to user"""
         try:
-            # Load existing warnings
-            warnings = JSONEngine.load_json(self.warnings_file, {})
+            # Cached warnings; written back by the periodic flush
+            warnings = write_cache.get(self.warnings_file, {})
             
             user_key = f"{chat_id}_{user_id}"
             
@@ -44,7 +44,7 @@ class AutoWarn:
             warnings[user_key].append(warning_entry)
             
             # Save warnings
-            JSONEngine.save_json(self.warnings_file, warnings)
+            write_cache.mark_dirty(self.warnings_file)
             
             warning_count = len(warnings[user_key])
             
@@ -6,25 +6,46 @@ User interface panels and menus
 __version__ = "1.0.0"
 __author__ = "RANA (MASTER)"
 
-from .start_panel import StartPanel
-from .help_panel import HelpPanel
-from .support_panel import SupportPanel
-from .add_group_panel import AddGroupPanel
+import importlib
 
-# Bot Admin Panels
-from .bot_admin_panel.dashboard import BotAdminDashboard
-from .bot_admin_panel.group_list import GroupListPanel
-from .bot_admin_panel.force_join import ForceJoinPanel
-from .bot_admin_panel.force_leave import ForceLeavePanel
-from .bot_admin_panel.payment_control import PaymentControlPanel
-from .bot_admin_panel.feature_override import FeatureOverridePanel
+# Panels are imported on first access (PEP 562) so `import panels` does not
+# pull in every panel's dependencies at startup
+_LAZY = {
+    'StartPanel': ('.start_panel', 'StartPanel'),
+    'HelpPanel': ('.help_panel', 'HelpPanel'),
+    'SupportPanel': ('.support_panel', 'SupportPanel'),
+    'AddGroupPanel': ('.add_group_panel', 'AddGroupPanel'),
+    
+    # Bot Admin Panels
+    'BotAdminDashboard': ('.bot_admin_panel.dashboard', 'BotAdminDashboard'),
+    'GroupListPanel': ('.bot_admin_panel.group_list', 'GroupListPanel'),
+    'ForceJoinPanel': ('.bot_admin_panel.force_join', 'ForceJoinPanel'),
+    'ForceLeavePanel': ('.bot_admin_panel.force_leave', 'ForceLeavePanel'),
+    'PaymentControlPanel': ('.bot_admin_panel.payment_control', 'PaymentControlPanel'),
+    'FeatureOverridePanel': ('.bot_admin_panel.feature_override', 'FeatureOverridePanel'),
+    
+    # Shared panel instances
+    'group_list_panel': ('.bot_admin_panel.group_list', 'group_list_panel'),
+    'payment_control_panel': ('.bot_admin_panel.payment_control', 'payment_control_panel'),
+    'feature_override_panel': ('.bot_admin_panel.feature_override', 'feature_override_panel'),
+    'group_admin_dashboard': ('.group_admin_panel.dashboard', 'group_admin_dashboard'),
+    'message_editor': ('.group_admin_panel.message_editor', 'message_editor'),
+    
+    # Group Admin Panels
+    'GroupAdminDashboard': ('.group_admin_panel.dashboard', 'GroupAdminDashboard'),
+    'ServiceTogglePanel': ('.group_admin_panel.service_toggle', 'ServiceTogglePanel'),
+    'TimeSlotEditor': ('.group_admin_panel.time_slot_editor', 'TimeSlotEditor'),
+    'MessageEditor': ('.group_admin_panel.message_editor', 'MessageEditor'),
+    'ModerationSettingsPanel': ('.group_admin_panel.moderation_settings', 'ModerationSettingsPanel'),
+}
 
-# Group Admin Panels
-from .group_admin_panel.dashboard import GroupAdminDashboard
-from .group_admin_panel.service_toggle import ServiceTogglePanel
-from .group_admin_panel.time_slot_editor import TimeSlotEditor
-from .group_admin_panel.message_editor import MessageEditor
-from .group_admin_panel.moderation_settings import ModerationSettingsPanel
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'StartPanel',
@@ -42,4 +63,9 @@ __all__ = [
     'TimeSlotEditor',
     'MessageEditor',
     'ModerationSettingsPanel',
+    'group_list_panel',
+    'payment_control_panel',
+    'feature_override_panel',
+    'group_admin_dashboard',
+    'message_editor',
 ]
\ No newline at end of file
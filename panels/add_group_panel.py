@@ -15,12 +15,12 @@ logger = logging.getLogger(__name__)
 class AddGroupPanel:
     """Add Group Setup Panel"""
     
+    __slots__ = ('config', 'instructions')
+    
     def __init__(self):
         self.config = Config
-    
-    async def show_add_group_instructions(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        """Show group addition instructions"""
-        instructions = f"""
+        # Only config constants are substituted, so the text is built once
+        self.instructions = f"""
 📦 <b>How to Add {self.config.BOT_NAME} to Your Group</b>
 
 <b>Step 1: Add Bot to Group</b>
@@ -61,10 +61,12 @@ class AddGroupPanel:
 <b>Need Help?</b>
 Contact: {self.config.DEVELOPER_CONTACT}
         """.strip()
-        
+    
+    async def show_add_group_instructions(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Show group addition instructions"""
         return {
             'action': 'send_message',
             'chat_id': message.get('chat', {}).get('id'),
-            'text': instructions,
+            'text': self.instructions,
             'parse_mode': 'HTML',
         }
\ No newline at end of file
@@ -5,14 +5,91 @@ Blue Rose Bot - Bot Admin Dashboard
 Global admin dashboard
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 from config import Config
 from storage.json_engine import JSONEngine
+from storage.json_cache import admin_ids
 
 logger = logging.getLogger(__name__)
 
+def _file_stamp(file_path) -> Tuple[int, int]:
+    """Modification time and size of a file, used as a cache key"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+# psutil readings are refreshed at most every few seconds, so bursts of
+# dashboard refreshes share one set of syscalls
+_SYSTEM_USAGE_TTL = 5.0
+_system_usage = {'expires': 0.0, 'memory_percent': None, 'disk_percent': None}
+
+def _get_system_usage() -> Dict[str, Any]:
+    """Memory and disk usage percentages"""
+    now = time.monotonic()
+    if now >= _system_usage['expires']:
+        import psutil
+        _system_usage['memory_percent'] = psutil.virtual_memory().percent
+        _system_usage['disk_percent'] = psutil.disk_usage('/').percent
+        _system_usage['expires'] = now + _SYSTEM_USAGE_TTL
+    return _system_usage
+
+# The cached helpers below take the file stamp as an argument, so they are
+# recomputed only after the file has been rewritten
+@lru_cache(maxsize=1)
+def _group_stats(file_path: str, stamp: Tuple[int, int]) -> Dict[str, int]:
+    """Total, active and paid group counts"""
+    groups = JSONEngine.load_json(file_path, {})
+    total_groups = len(groups)
+    active_groups = paid_groups = 0
+    for g in groups.values():
+        if g.get('active', True):
+            active_groups += 1
+        if g.get('plan') != 'free':
+            paid_groups += 1
+    
+    return {
+        'total_groups': total_groups,
+        'active_groups': active_groups,
+        'paid_groups': paid_groups,
+    }
+
+@lru_cache(maxsize=1)
+def _user_count(file_path: str, stamp: Tuple[int, int]) -> int:
+    """Number of known users"""
+    return len(JSONEngine.load_json(file_path, {}))
+
+@lru_cache(maxsize=1)
+def _payment_request_stats(file_path: str, stamp: Tuple[int, int], today: str) -> Dict[str, int]:
+    """Pending and today's processed payment request counts"""
+    requests = JSONEngine.load_json(file_path, [])
+    # One pass over the requests for all three counters
+    pending_requests = approved_today = rejected_today = 0
+    for r in requests:
+        status = r.get('status')
+        if status == 'pending':
+            pending_requests += 1
+        elif status == 'approved':
+            if r.get('processed_at', '').startswith(today):
+                approved_today += 1
+        elif status == 'rejected':
+            if r.get('processed_at', '').startswith(today):
+                rejected_today += 1
+    
+    return {
+        'pending_requests': pending_requests,
+        'approved_today': approved_today,
+        'rejected_today': rejected_today,
+    }
+
 class BotAdminDashboard:
     """Bot Admin Dashboard"""
     
@@ -23,9 +100,7 @@ class BotAdminDashboard:
         """Show bot admin dashboard"""
         # Check if user is bot owner/admin
         if user_id != self.config.BOT_OWNER_ID:
-            from storage.json_engine import JSONEngine
-            bot_admins = JSONEngine.load_json(self.config.JSON_PATHS['bot_admins'], {})
-            if user_id not in bot_admins.get('admins', []):
+            if user_id not in admin_ids(self.config.JSON_PATHS['bot_admins']):
                 return {
                     'action': 'send_message',
                     'chat_id': user_id,
@@ -79,50 +154,8 @@ Use the buttons below for specific actions.
     async def _get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
         try:
-            # Group statistics
-            groups = JSONEngine.load_json(self.config.JSON_PATHS['groups'], {})
-            total_groups = len(groups)
-            active_groups = sum(1 for g in groups.values() if g.get('active', True))
-            paid_groups = sum(1 for g in groups.values() if g.get('plan') != 'free')
-            
-            # User statistics (simplified)
-            users = JSONEngine.load_json(self.config.DATA_DIR / "users" / "users.json", {})
-            total_users = len(users)
-            
-            # Payment statistics
-            requests = JSONEngine.load_json(self.config.JSON_PATHS['payment_requests'], [])
-            pending_requests = sum(1 for r in requests if r.get('status') == 'pending')
-            
-            from datetime import datetime
-            today = datetime.now().strftime('%Y-%m-%d')
-            approved_today = sum(1 for r in requests 
-                               if r.get('status') == 'approved' and 
-                               r.get('processed_at', '').startswith(today))
-            rejected_today = sum(1 for r in requests 
-                               if r.get('status') == 'rejected' and 
-                               r.get('processed_at', '').startswith(today))
-            
-            # Revenue calculation (simplified)
-            total_revenue = paid_groups * 100  # Simplified calculation
-            
-            # System stats (simplified)
-            import psutil
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            
-            return {
-                'total_groups': total_groups,
-                'active_groups': active_groups,
-                'paid_groups': paid_groups,
-                'total_users': total_users,
-                'pending_requests': pending_requests,
-                'approved_today': approved_today,
-                'rejected_today': rejected_today,
-                'total_revenue': total_revenue,
-                'memory_usage': f"{memory.percent}%",
-                'storage_used': f"{disk.percent}%",
-                'db_size': "Calculating...",
-            }
+            # File loads and psutil calls block, so they run in a worker thread
+            return await asyncio.to_thread(self._collect_system_stats)
             
         except Exception as e:
             logger.error(f"Failed to get system stats: {e}")
@@ -138,4 +171,35 @@ Use the buttons below for specific actions.
                 'memory_usage': "N/A",
                 'storage_used': "N/A",
                 'db_size': "N/A",
-            }
\ No newline at end of file
+            }
+    
+    def _collect_system_stats(self) -> Dict[str, Any]:
+        """Collect system statistics"""
+        # Group statistics
+        groups_file = str(self.config.JSON_PATHS['groups'])
+        group_stats = _group_stats(groups_file, _file_stamp(groups_file))
+        
+        # User statistics (simplified)
+        users_file = str(self.config.DATA_DIR / "users" / "users.json")
+        total_users = _user_count(users_file, _file_stamp(users_file))
+        
+        # Payment statistics
+        requests_file = str(self.config.JSON_PATHS['payment_requests'])
+        today = datetime.now().strftime('%Y-%m-%d')
+        payment_stats = _payment_request_stats(requests_file, _file_stamp(requests_file), today)
+        
+        # Revenue calculation (simplified)
+        total_revenue = group_stats['paid_groups'] * 100  # Simplified calculation
+        
+        # System stats (simplified)
+        system_usage = _get_system_usage()
+        
+        return {
+            **group_stats,
+            'total_users': total_users,
+            **payment_stats,
+            'total_revenue': total_revenue,
+            'memory_usage': f"{system_usage['memory_percent']}%",
+            'storage_used': f"{system_usage['disk_percent']}%",
+            'db_size': "Calculating...",
+        }
\ No newline at end of file
@@ -5,17 +5,27 @@ Blue Rose Bot - Feature Override Panel
 Bot admin feature override controls
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Any
 
 from config import Config
 from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache, admin_ids
 
 logger = logging.getLogger(__name__)
 
+# Edits load, change and save the whole services file; holding one lock per
+# path from load to save keeps a concurrent edit from saving over another
+_services_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
 class FeatureOverridePanel:
     """Feature Override Panel for Bot Admin"""
     
+    __slots__ = ('config',)
+    
     def __init__(self):
         self.config = Config
         
@@ -23,14 +33,13 @@ class FeatureOverridePanel:
         """Get current feature status for a group"""
         try:
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
-            
-            group_key = str(group_id)
-            if group_key in group_services.get('group_services', {}):
-                return group_services['group_services'][group_key]
+            group_services = json_cache.load(group_services_path, {})
             
-            # Return default services
-            return group_services.get('services', {})
+            try:
+                return group_services['group_services'][str(group_id)]
+            except KeyError:
+                # Return default services
+                return group_services.get('services', {})
         
         except Exception as e:
             logger.error(f"Failed to get group features: {e}")
@@ -47,28 +56,30 @@ class FeatureOverridePanel:
                 return False
             
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
-            
-            group_key = str(group_id)
-            
-            # Initialize group services if not exists
-            if 'group_services' not in group_services:
-                group_services['group_services'] = {}
             
-            if group_key not in group_services['group_services']:
-                group_services['group_services'][group_key] = {}
-            
-            # Set feature override
-            group_services['group_services'][group_key][feature] = {
-                'enabled': enabled,
-                'overridden': True,
-                'overridden_by': admin_id,
-                'overridden_at': self._get_timestamp(),
-                'original_value': await self._get_original_value(feature)
-            }
-            
-            # Save changes
-            JSONEngine.save_json(group_services_path, group_services)
+            async with _services_locks[str(group_services_path)]:
+                group_services = JSONEngine.load_json(group_services_path, {})
+                
+                group_key = str(group_id)
+                
+                # Initialize group services if not exists
+                if 'group_services' not in group_services:
+                    group_services['group_services'] = {}
+                
+                if group_key not in group_services['group_services']:
+                    group_services['group_services'][group_key] = {}
+                
+                # Set feature override
+                group_services['group_services'][group_key][feature] = {
+                    'enabled': enabled,
+                    'overridden': True,
+                    'overridden_by': admin_id,
+                    'overridden_at': self._get_timestamp(),
+                    'original_value': self._original_value_from(group_services, feature)
+                }
+                
+                # Save changes
+                await JSONEngine.save_json_async(group_services_path, group_services)
             
             logger.info(
                 f"Feature {feature} {'enabled' if enabled else 'disabled'} "
@@ -91,32 +102,37 @@ class FeatureOverridePanel:
                 return False
             
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
             
-            group_key = str(group_id)
-            
-            # Check if override exists
-            if (group_key in group_services.get('group_services', {}) and 
-                feature in group_services['group_services'][group_key]):
+            async with _services_locks[str(group_services_path)]:
+                group_services = JSONEngine.load_json(group_services_path, {})
+                
+                group_key = str(group_id)
+                
+                # Check if override exists
+                try:
+                    group_overrides = group_services['group_services'][group_key]
+                except KeyError:
+                    group_overrides = None
+                
+                if group_overrides is None or feature not in group_overrides:
+                    return False
                 
                 # Remove override
-                del group_services['group_services'][group_key][feature]
+                del group_overrides[feature]
                 
                 # If no overrides left, remove group entry
-                if not group_services['group_services'][group_key]:
+                if not group_overrides:
                     del group_services['group_services'][group_key]
                 
                 # Save changes
-                JSONEngine.save_json(group_services_path, group_services)
-                
-                logger.info(
-                    f"Feature {feature} reset to default "
-                    f"for group {group_id} by admin {admin_id}"
-                )
-                
-                return True
+                await JSONEngine.save_json_async(group_services_path, group_services)
             
-            return False
+            logger.info(
+                f"Feature {feature} reset to default "
+                f"for group {group_id} by admin {admin_id}"
+            )
+            
+            return True
         
         except Exception as e:
             logger.error(f"Failed to reset feature: {e}")
@@ -126,7 +142,7 @@ class FeatureOverridePanel:
         """Get all feature overrides"""
         try:
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
+            group_services = json_cache.load(group_services_path, {})
             
             return group_services.get('group_services', {})
         
@@ -141,12 +157,8 @@ class FeatureOverridePanel:
             if admin_id == self.config.BOT_OWNER_ID:
                 return True
             
-            # Check if in bot admin list
-            bot_admins_path = self.config.JSON_PATHS['bot_admins']
-            bot_admins = JSONEngine.load_json(bot_admins_path, {})
-            
-            admin_ids = bot_admins.get('admins', [])
-            return admin_id in admin_ids
+            # Check if in bot admin set, rebuilt only when the file changes
+            return admin_id in admin_ids(self.config.JSON_PATHS['bot_admins'])
         
         except Exception as e:
             logger.error(f"Failed to validate admin: {e}")
@@ -156,21 +168,24 @@ class FeatureOverridePanel:
         """Get original/default value for a feature"""
         try:
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
+            group_services = json_cache.load(group_services_path, {})
             
-            services = group_services.get('services', {})
-            if feature in services:
-                return services[feature].get('enabled', False)
-            
-            return False
+            return self._original_value_from(group_services, feature)
         
         except Exception as e:
             logger.error(f"Failed to get original value: {e}")
             return False
     
+    @staticmethod
+    def _original_value_from(group_services: Dict[str, Any], feature: str) -> bool:
+        """Get original/default value for a feature from loaded services"""
+        try:
+            return group_services['services'][feature].get('enabled', False)
+        except KeyError:
+            return False
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     async def create_override_report(self) -> str:
@@ -199,4 +214,7 @@ class FeatureOverridePanel:
         
         except Exception as e:
             logger.error(f"Failed to create report: {e}")
-            return f"Error generating report: {e}"
\ No newline at end of file
+            return f"Error generating report: {e}"
+
+# Shared panel instance
+feature_override_panel = FeatureOverridePanel()
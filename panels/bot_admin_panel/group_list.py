@@ -6,22 +6,25 @@ List all groups managed by bot
 """
 
 import logging
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any
 
 from config import Config
-from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache
 
 logger = logging.getLogger(__name__)
 
 class GroupListPanel:
     """Group List Management Panel"""
     
+    __slots__ = ('config',)
+    
     def __init__(self):
         self.config = Config
     
     async def show_group_list(self, user_id: int, page: int = 1) -> Dict[str, Any]:
         """Show paginated group list"""
-        groups = JSONEngine.load_json(self.config.JSON_PATHS['groups'], {})
+        groups = json_cache.load(self.config.JSON_PATHS['groups'], {})
         
         if not groups:
             return {
@@ -31,22 +34,22 @@ class GroupListPanel:
                 'parse_mode': 'HTML',
             }
         
-        # Paginate groups
-        groups_list = list(groups.items())
+        # Paginate groups; only the requested page is materialized
+        total_groups = len(groups)
         items_per_page = 10
-        total_pages = (len(groups_list) + items_per_page - 1) // items_per_page
+        total_pages = (total_groups + items_per_page - 1) // items_per_page
         page = max(1, min(page, total_pages))
         
         start_idx = (page - 1) * items_per_page
         end_idx = start_idx + items_per_page
-        page_groups = groups_list[start_idx:end_idx]
+        page_groups = list(islice(groups.items(), start_idx, end_idx))
         
-        # Build group list text
-        group_text = f"""
+        # Build group list text from parts, joined once
+        parts = [f"""
 📋 <b>Managed Groups</b>
-Page {page}/{total_pages} • Total: {len(groups_list)} groups
+Page {page}/{total_pages} • Total: {total_groups} groups
 
-"""
+"""]
         
         for idx, (chat_id_str, group_data) in enumerate(page_groups, start_idx + 1):
             title = group_data.get('title', 'Unknown Group')
@@ -56,17 +59,18 @@ Page {page}/{total_pages} • Total: {len(groups_list)} groups
             status_emoji = '✅' if active else '❌'
             plan_emoji = '💰' if plan != 'free' else '🆓'
             
-            group_text += f"{idx}. {status_emoji} <b>{title}</b>\n"
-            group_text += f"   ID: <code>{chat_id_str}</code>\n"
-            group_text += f"   Plan: {plan_emoji} {plan.title()}\n"
+            parts.append(f"{idx}. {status_emoji} <b>{title}</b>\n")
+            parts.append(f"   ID: <code>{chat_id_str}</code>\n")
+            parts.append(f"   Plan: {plan_emoji} {plan.title()}\n")
             
             # Show expiry if paid plan
             if plan != 'free' and group_data.get('expiry_date'):
-                group_text += f"   Expires: {group_data['expiry_date'][:10]}\n"
+                parts.append(f"   Expires: {group_data['expiry_date'][:10]}\n")
             
-            group_text += "\n"
+            parts.append("\n")
         
-        group_text += "\nUse /admin to return to admin dashboard."
+        parts.append("\nUse /admin to return to admin dashboard.")
+        group_text = "".join(parts)
         
         from keyboards.admin_menu import AdminMenuKeyboard
         keyboard = AdminMenuKeyboard().get_group_list_keyboard(page, total_pages)
@@ -77,4 +81,7 @@ Page {page}/{total_pages} • Total: {len(groups_list)} groups
             'text': group_text,
             'parse_mode': 'HTML',
             'reply_markup': keyboard,
-        }
\ No newline at end of file
+        }
+
+# Shared panel instance
+group_list_panel = GroupListPanel()
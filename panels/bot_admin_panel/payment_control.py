@@ -5,11 +5,15 @@ Blue Rose Bot - Payment Control Panel
 Payment request management
 """
 
+from typing import Dict, Any
+
 from payments.approval_panel import ApprovalPanel
 
 class PaymentControlPanel:
     """Payment Control Panel"""
     
+    __slots__ = ('approval_panel',)
+    
     def __init__(self):
         self.approval_panel = ApprovalPanel()
     
@@ -49,4 +53,7 @@ Total: {len(requests)} requests
             'text': request_text,
             'parse_mode': 'HTML',
             'reply_markup': keyboard,
-        }
\ No newline at end of file
+        }
+
+# Shared panel instance
+payment_control_panel = PaymentControlPanel()
@@ -6,17 +6,24 @@ Group-specific admin dashboard
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from config import Config
-from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache
 from core.permission_engine import PermissionEngine
 
 logger = logging.getLogger(__name__)
 
+# chat_id -> (group record the text was built from, dashboard text). The
+# read cache hands back the same record object until groups.json changes,
+# so an identity check is enough to know the text is current.
+_dashboard_texts: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
 class GroupAdminDashboard:
     """Group Admin Dashboard"""
     
+    __slots__ = ('config', 'permission_engine')
+    
     def __init__(self):
         self.config = Config
         self.permission_engine = PermissionEngine()
@@ -37,7 +44,7 @@ class GroupAdminDashboard:
             }
         
         # Get group info
-        groups = JSONEngine.load_json(self.config.JSON_PATHS['groups'], {})
+        groups = json_cache.load(self.config.JSON_PATHS['groups'], {})
         group_key = str(chat_id)
         
         if group_key not in groups:
@@ -50,8 +57,27 @@ class GroupAdminDashboard:
         
         group_data = groups[group_key]
         
-        # Build dashboard
-        dashboard_text = f"""
+        cached = _dashboard_texts.get(chat_id)
+        if cached is not None and cached[0] is group_data:
+            dashboard_text = cached[1]
+        else:
+            dashboard_text = self._build_dashboard_text(chat_id, group_data)
+            _dashboard_texts[chat_id] = (group_data, dashboard_text)
+        
+        from keyboards.group_admin_menu import GroupAdminMenu
+        keyboard = GroupAdminMenu.main_menu(chat_id)
+        
+        return {
+            'action': 'send_message',
+            'chat_id': chat_id,
+            'text': dashboard_text,
+            'parse_mode': 'HTML',
+            'reply_markup': keyboard,
+        }
+    
+    def _build_dashboard_text(self, chat_id: int, group_data: Dict[str, Any]) -> str:
+        """Build the dashboard text for a group"""
+        return f"""
 🏠 <b>Group Admin Dashboard</b>
 
 <b>Group Info:</b>
@@ -77,14 +103,6 @@ class GroupAdminDashboard:
 <b>Quick Actions:</b>
 Use buttons below to manage group settings.
         """.strip()
-        
-        from keyboards.group_admin_menu import GroupAdminMenuKeyboard
-        keyboard = GroupAdminMenuKeyboard().get_dashboard_keyboard()
-        
-        return {
-            'action': 'send_message',
-            'chat_id': chat_id,
-            'text': dashboard_text,
-            'parse_mode': 'HTML',
-            'reply_markup': keyboard,
-        }
\ No newline at end of file
+
+# Shared dashboard instance
+group_admin_dashboard = GroupAdminDashboard()
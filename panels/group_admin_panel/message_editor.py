@@ -5,17 +5,34 @@ Blue Rose Bot - Message Editor Panel
 Group admin message template editing
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
 from config import Config
 from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache, admin_ids
+from storage.write_cache import write_cache
 
 logger = logging.getLogger(__name__)
 
+# Template placeholders such as {user_name}
+_VARIABLE_RE = re.compile(r'\{(\w+)\}')
+
+# The single group_templates.json file is split into one file per group
+# the first time group templates are used
+_group_templates_migrated = False
+_migration_lock = threading.Lock()
+
 class MessageEditor:
     """Message Editor for Group Admin"""
     
+    __slots__ = ('config',)
+    
     def __init__(self):
         self.config = Config
         
@@ -31,7 +48,8 @@ class MessageEditor:
                 # Return empty structure
                 return {'templates': {}}
             
-            templates = JSONEngine.load_json(file_path, {})
+            # Read-only; the file is parsed off the event loop
+            templates = await JSONEngine.run_io(json_cache.load, file_path, {})
             return templates
         
         except Exception as e:
@@ -42,25 +60,19 @@ class MessageEditor:
                                 message_type: str) -> Dict[str, Any]:
         """Get group-specific message templates"""
         try:
-            # First get default templates
-            default_templates = await self.get_message_templates(message_type)
-            
-            # Check for group overrides
-            group_templates_path = self.config.DATA_DIR / "messages" / "group_templates.json"
-            
-            if not group_templates_path.exists():
-                return default_templates
-            
-            group_templates = JSONEngine.load_json(group_templates_path, {})
-            group_key = str(group_id)
+            # Default templates and group overrides are loaded together
+            default_templates, group_templates = await self._load_type_and_overrides(
+                group_id, message_type
+            )
             
-            if (group_key in group_templates and 
-                message_type in group_templates[group_key]):
-                # Merge defaults with group overrides
-                result = default_templates.copy()
-                result['templates'].update(group_templates[group_key][message_type])
-                result['group_override'] = True
-                return result
+            if message_type in group_templates:
+                # Merge defaults with group overrides into new dicts, so
+                # the cached defaults stay untouched
+                return {
+                    **default_templates,
+                    'templates': {**default_templates.get('templates', {}), **group_templates[message_type]},
+                    'group_override': True,
+                }
             
             return default_templates
         
@@ -68,13 +80,67 @@ class MessageEditor:
             logger.error(f"Failed to get group templates: {e}")
             return {'templates': {}}
     
+    async def _load_type_and_overrides(self, group_id: int,
+                                       message_type: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Load default templates and group overrides concurrently"""
+        default_templates, group_templates = await asyncio.gather(
+            self.get_message_templates(message_type),
+            JSONEngine.run_io(self._load_group_templates, group_id),
+        )
+        
+        return default_templates, group_templates
+    
+    def _load_group_templates(self, group_id: int) -> Dict[str, Any]:
+        """Load one group's template overrides (read-only)"""
+        group_templates_path = self._group_templates_path(group_id)
+        
+        if not group_templates_path.exists():
+            return {}
+        
+        # Edits live in the write cache until the next flush
+        return write_cache.get(group_templates_path, {})
+    
+    def _group_templates_path(self, group_id: int) -> Path:
+        """Path of a group's template overrides file"""
+        self._migrate_group_templates()
+        return self.config.DATA_DIR / "messages" / "group_templates" / f"{group_id}.json"
+    
+    def _migrate_group_templates(self):
+        """Split the old group_templates.json into one file per group"""
+        global _group_templates_migrated
+        
+        if _group_templates_migrated:
+            return
+        
+        with _migration_lock:
+            if _group_templates_migrated:
+                return
+            
+            old_path = self.config.DATA_DIR / "messages" / "group_templates.json"
+            if old_path.exists():
+                group_templates = JSONEngine.load_json(old_path, {})
+                groups_dir = old_path.parent / "group_templates"
+                
+                for group_key, templates in group_templates.items():
+                    group_path = groups_dir / f"{group_key}.json"
+                    # Files written by a newer run take precedence
+                    if not group_path.exists():
+                        if not JSONEngine.save_json(group_path, templates):
+                            logger.error(f"Failed to migrate templates for group {group_key}")
+                            return
+                
+                old_path.rename(old_path.with_name("group_templates.json.migrated"))
+                logger.info(f"Migrated templates of {len(group_templates)} groups to {groups_dir}")
+            
+            _group_templates_migrated = True
+    
     async def update_template(self, group_id: int,
                             message_type: str,
                             template_name: str,
                             text: str,
+                            admin_id: int, *,
                             parse_mode: str = "HTML",
-                            variables: Optional[Dict] = None,
-                            admin_id: int) -> bool:
+                            variables: Optional[Dict] = None) -> bool:
         """Update a message template"""
         try:
             # Check admin permissions
@@ -85,25 +151,18 @@ class MessageEditor:
             if parse_mode not in ['HTML', 'Markdown', 'MarkdownV2']:
                 parse_mode = "HTML"
             
-            group_templates_path = self.config.DATA_DIR / "messages" / "group_templates.json"
+            group_templates_path = self._group_templates_path(group_id)
             
-            # Load or create group templates
-            if group_templates_path.exists():
-                group_templates = JSONEngine.load_json(group_templates_path, {})
-            else:
-                group_templates = {}
-            
-            group_key = str(group_id)
+            # Load or create group templates; edits are batched in the
+            # write cache, so several edits in a row cost one write
+            group_templates = write_cache.get(group_templates_path, {})
             
             # Initialize structures if not exists
-            if group_key not in group_templates:
-                group_templates[group_key] = {}
-            
-            if message_type not in group_templates[group_key]:
-                group_templates[group_key][message_type] = {}
+            if message_type not in group_templates:
+                group_templates[message_type] = {}
             
             # Update template
-            group_templates[group_key][message_type][template_name] = {
+            group_templates[message_type][template_name] = {
                 'text': text,
                 'parse_mode': parse_mode,
                 'variables': variables or {},
@@ -112,7 +171,7 @@ class MessageEditor:
             }
             
             # Save changes
-            JSONEngine.save_json(group_templates_path, group_templates)
+            write_cache.mark_dirty(group_templates_path)
             
             logger.info(
                 f"Template {template_name} ({message_type}) updated "
@@ -135,31 +194,26 @@ class MessageEditor:
             if not await self._validate_group_admin(group_id, admin_id):
                 return False
             
-            group_templates_path = self.config.DATA_DIR / "messages" / "group_templates.json"
+            group_templates_path = self._group_templates_path(group_id)
             
             if not group_templates_path.exists():
                 return False
             
-            group_templates = JSONEngine.load_json(group_templates_path, {})
-            group_key = str(group_id)
+            group_templates = write_cache.get(group_templates_path, {})
             
             # Check if template exists
-            if (group_key in group_templates and 
-                message_type in group_templates[group_key] and 
-                template_name in group_templates[group_key][message_type]):
+            if (message_type in group_templates and 
+                template_name in group_templates[message_type]):
                 
                 # Delete template
-                del group_templates[group_key][message_type][template_name]
+                del group_templates[message_type][template_name]
                 
                 # Clean up empty structures
-                if not group_templates[group_key][message_type]:
-                    del group_templates[group_key][message_type]
-                
-                if not group_templates[group_key]:
-                    del group_templates[group_key]
+                if not group_templates[message_type]:
+                    del group_templates[message_type]
                 
                 # Save changes
-                JSONEngine.save_json(group_templates_path, group_templates)
+                write_cache.mark_dirty(group_templates_path)
                 
                 logger.info(
                     f"Template {template_name} ({message_type}) deleted "
@@ -185,9 +239,9 @@ class MessageEditor:
                                    message_type: str,
                                    template_name: str,
                                    text: str,
+                                   admin_id: int, *,
                                    parse_mode: str = "HTML",
-                                   variables: Optional[Dict] = None,
-                                   admin_id: int) -> bool:
+                                   variables: Optional[Dict] = None) -> bool:
         """Create a custom template"""
         try:
             # Check if template already exists in defaults
@@ -197,7 +251,8 @@ class MessageEditor:
                 return False
             
             return await self.update_template(
-                group_id, message_type, template_name, text, parse_mode, variables, admin_id
+                group_id, message_type, template_name, text, admin_id,
+                parse_mode=parse_mode, variables=variables
             )
         
         except Exception as e:
@@ -219,12 +274,12 @@ class MessageEditor:
             template = templates['templates'][template_name]
             text = template.get('text', '')
             
-            # Replace variables
-            for key, value in context.items():
-                placeholder = f"{{{key}}}"
-                text = text.replace(placeholder, str(value))
+            # Replace variables in one pass; unknown placeholders are kept
+            def replace(match):
+                key = match.group(1)
+                return str(context[key]) if key in context else match.group(0)
             
-            return text
+            return _VARIABLE_RE.sub(replace, text)
         
         except Exception as e:
             logger.error(f"Failed to render template: {e}")
@@ -240,12 +295,8 @@ class MessageEditor:
             
             # Check group admins
             group_admins_path = self.config.DATA_DIR / "groups" / "group_admins.json"
-            group_admins = JSONEngine.load_json(group_admins_path, {})
-            
-            group_key = str(group_id)
-            admins = group_admins.get('groups', {}).get(group_key, {}).get('admins', [])
             
-            return user_id in admins
+            return user_id in admin_ids(group_admins_path, group_id)
         
         except Exception as e:
             logger.error(f"Failed to validate group admin: {e}")
@@ -253,7 +304,6 @@ class MessageEditor:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     async def get_available_variables(self, message_type: str) -> List[str]:
@@ -278,8 +328,12 @@ class MessageEditor:
             total_templates = 0
             custom_templates = 0
             
-            for msg_type in message_types:
-                templates = await self.get_group_templates(group_id, msg_type)
+            # The per-type lookups are independent
+            results = await asyncio.gather(
+                *(self.get_group_templates(group_id, msg_type) for msg_type in message_types)
+            )
+            
+            for msg_type, templates in zip(message_types, results):
                 template_count = len(templates.get('templates', {}))
                 
                 if template_count > 0:
@@ -297,4 +351,7 @@ class MessageEditor:
         
         except Exception as e:
             logger.error(f"Failed to create report: {e}")
-            return f"Error generating report: {e}"
\ No newline at end of file
+            return f"Error generating report: {e}"
+
+# Shared editor instance
+message_editor = MessageEditor()
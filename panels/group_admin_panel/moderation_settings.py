@@ -6,13 +6,103 @@ Group admin moderation configuration
 """
 
 import logging
+from datetime import datetime
 from typing import Dict, Any, Optional
 
 from config import Config
 from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache, admin_ids
 
 logger = logging.getLogger(__name__)
 
+# Default value of every moderation setting
+_DEFAULT_SETTINGS = {
+    'max_warnings': 3,
+    'mute_duration': 3600,  # 1 hour in seconds
+    'ban_duration': 86400,  # 24 hours in seconds
+    'anti_spam_threshold': 5,
+    'anti_flood_threshold': 10,
+    'anti_link_enabled': True,
+    'anti_forward_enabled': False,
+    'anti_bot_enabled': True,
+    'warn_on_links': True,
+    'mute_on_spam': True,
+    'ban_on_flood': False,
+    'delete_spam_messages': True,
+    'delete_flood_messages': True,
+    'notify_admins': True,
+    'log_moderation': True,
+    'allow_admin_bypass': False,
+    'raid_protection': True,
+    'raid_threshold': 5,
+    'raid_time_window': 10,  # seconds
+    'require_captcha': False,
+    'captcha_timeout': 300,  # 5 minutes
+    'welcome_message_enabled': True,
+    'goodbye_message_enabled': True,
+    'rules_enforced': True,
+    'rules_message': "Please follow group rules.",
+    'emergency_lock_enabled': True
+}
+
+_SETTING_DESCRIPTIONS = {
+    'max_warnings': 'Maximum warnings before action',
+    'mute_duration': 'Mute duration in seconds',
+    'ban_duration': 'Ban duration in seconds',
+    'anti_spam_threshold': 'Messages per minute for spam detection',
+    'anti_flood_threshold': 'Messages per second for flood detection',
+    'anti_link_enabled': 'Enable anti-link protection',
+    'anti_forward_enabled': 'Enable anti-forward protection',
+    'anti_bot_enabled': 'Enable anti-bot protection',
+    'warn_on_links': 'Warn users posting links',
+    'mute_on_spam': 'Mute users for spam',
+    'ban_on_flood': 'Ban users for flooding',
+    'delete_spam_messages': 'Delete spam messages automatically',
+    'delete_flood_messages': 'Delete flood messages automatically',
+    'notify_admins': 'Notify admins of moderation actions',
+    'log_moderation': 'Log all moderation actions',
+    'allow_admin_bypass': 'Allow admins to bypass restrictions',
+    'raid_protection': 'Enable raid protection',
+    'raid_threshold': 'New members per second for raid detection',
+    'raid_time_window': 'Time window for raid detection (seconds)',
+    'require_captcha': 'Require captcha for new members',
+    'captcha_timeout': 'Captcha timeout in seconds',
+    'welcome_message_enabled': 'Enable welcome messages',
+    'goodbye_message_enabled': 'Enable goodbye messages',
+    'rules_enforced': 'Enforce group rules',
+    'rules_message': 'Rules message to display',
+    'emergency_lock_enabled': 'Enable emergency lockdown'
+}
+
+# Report sections, in display order
+_REPORT_CATEGORIES = (
+    ('Warnings & Actions', (
+        'max_warnings', 'mute_duration', 'ban_duration',
+        'warn_on_links', 'mute_on_spam', 'ban_on_flood'
+    )),
+    ('Spam & Flood Protection', (
+        'anti_spam_threshold', 'anti_flood_threshold',
+        'delete_spam_messages', 'delete_flood_messages'
+    )),
+    ('Content Filtering', (
+        'anti_link_enabled', 'anti_forward_enabled', 'anti_bot_enabled'
+    )),
+    ('Security & Protection', (
+        'raid_protection', 'raid_threshold', 'raid_time_window',
+        'require_captcha', 'captcha_timeout', 'emergency_lock_enabled'
+    )),
+    ('Notifications & Logging', (
+        'notify_admins', 'log_moderation'
+    )),
+    ('Messages & Rules', (
+        'welcome_message_enabled', 'goodbye_message_enabled',
+        'rules_enforced', 'rules_message'
+    )),
+    ('Permissions', (
+        'allow_admin_bypass',
+    )),
+)
+
 class ModerationSettings:
     """Moderation Settings for Group Admin"""
     
@@ -26,9 +116,10 @@ class ModerationSettings:
             
             if not settings_path.exists():
                 # Return default settings
-                return self._get_default_settings()
+                return dict(_DEFAULT_SETTINGS)
             
-            settings = JSONEngine.load_json(settings_path, {})
+            # Read-only; parsed again only after the file changes
+            settings = json_cache.load(settings_path, {})
             group_key = str(group_id)
             
             # Get group-specific settings if exists
@@ -36,15 +127,14 @@ class ModerationSettings:
             
             if group_settings:
                 # Merge with defaults
-                default_settings = self._get_default_settings()
-                return {**default_settings, **group_settings}
+                return {**_DEFAULT_SETTINGS, **group_settings}
             
             # Return default settings
-            return self._get_default_settings()
+            return dict(_DEFAULT_SETTINGS)
         
         except Exception as e:
             logger.error(f"Failed to get moderation settings: {e}")
-            return self._get_default_settings()
+            return dict(_DEFAULT_SETTINGS)
     
     async def update_setting(self, group_id: int,
                            setting_key: str,
@@ -53,8 +143,7 @@ class ModerationSettings:
         """Update a moderation setting"""
         try:
             # Validate setting key
-            default_settings = self._get_default_settings()
-            if setting_key not in default_settings:
+            if setting_key not in _DEFAULT_SETTINGS:
                 logger.error(f"Invalid setting key: {setting_key}")
                 return False
             
@@ -181,34 +270,7 @@ class ModerationSettings:
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """Get default moderation settings"""
-        return {
-            'max_warnings': 3,
-            'mute_duration': 3600,  # 1 hour in seconds
-            'ban_duration': 86400,  # 24 hours in seconds
-            'anti_spam_threshold': 5,
-            'anti_flood_threshold': 10,
-            'anti_link_enabled': True,
-            'anti_forward_enabled': False,
-            'anti_bot_enabled': True,
-            'warn_on_links': True,
-            'mute_on_spam': True,
-            'ban_on_flood': False,
-            'delete_spam_messages': True,
-            'delete_flood_messages': True,
-            'notify_admins': True,
-            'log_moderation': True,
-            'allow_admin_bypass': False,
-            'raid_protection': True,
-            'raid_threshold': 5,
-            'raid_time_window': 10,  # seconds
-            'require_captcha': False,
-            'captcha_timeout': 300,  # 5 minutes
-            'welcome_message_enabled': True,
-            'goodbye_message_enabled': True,
-            'rules_enforced': True,
-            'rules_message': "Please follow group rules.",
-            'emergency_lock_enabled': True
-        }
+        return dict(_DEFAULT_SETTINGS)
     
     async def _validate_group_admin(self, group_id: int, user_id: int) -> bool:
         """Validate group admin permissions"""
@@ -220,12 +282,8 @@ class ModerationSettings:
             
             # Check group admins
             group_admins_path = self.config.DATA_DIR / "groups" / "group_admins.json"
-            group_admins = JSONEngine.load_json(group_admins_path, {})
             
-            group_key = str(group_id)
-            admins = group_admins.get('groups', {}).get(group_key, {}).get('admins', [])
-            
-            return user_id in admins
+            return user_id in admin_ids(group_admins_path, group_id)
         
         except Exception as e:
             logger.error(f"Failed to validate group admin: {e}")
@@ -233,41 +291,11 @@ class ModerationSettings:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     async def get_setting_description(self, setting_key: str) -> str:
         """Get description for a setting"""
-        descriptions = {
-            'max_warnings': 'Maximum warnings before action',
-            'mute_duration': 'Mute duration in seconds',
-            'ban_duration': 'Ban duration in seconds',
-            'anti_spam_threshold': 'Messages per minute for spam detection',
-            'anti_flood_threshold': 'Messages per second for flood detection',
-            'anti_link_enabled': 'Enable anti-link protection',
-            'anti_forward_enabled': 'Enable anti-forward protection',
-            'anti_bot_enabled': 'Enable anti-bot protection',
-            'warn_on_links': 'Warn users posting links',
-            'mute_on_spam': 'Mute users for spam',
-            'ban_on_flood': 'Ban users for flooding',
-            'delete_spam_messages': 'Delete spam messages automatically',
-            'delete_flood_messages': 'Delete flood messages automatically',
-            'notify_admins': 'Notify admins of moderation actions',
-            'log_moderation': 'Log all moderation actions',
-            'allow_admin_bypass': 'Allow admins to bypass restrictions',
-            'raid_protection': 'Enable raid protection',
-            'raid_threshold': 'New members per second for raid detection',
-            'raid_time_window': 'Time window for raid detection (seconds)',
-            'require_captcha': 'Require captcha for new members',
-            'captcha_timeout': 'Captcha timeout in seconds',
-            'welcome_message_enabled': 'Enable welcome messages',
-            'goodbye_message_enabled': 'Enable goodbye messages',
-            'rules_enforced': 'Enforce group rules',
-            'rules_message': 'Rules message to display',
-            'emergency_lock_enabled': 'Enable emergency lockdown'
-        }
-        
-        return descriptions.get(setting_key, "No description available")
+        return _SETTING_DESCRIPTIONS.get(setting_key, "No description available")
     
     async def create_settings_report(self, group_id: int) -> str:
         """Create moderation settings report for group"""
@@ -277,42 +305,12 @@ class ModerationSettings:
             report_lines = ["🛡️ **Moderation Settings Report**\n"]
             report_lines.append(f"**Group ID:** `{group_id}`\n")
             
-            # Group settings by category
-            categories = {
-                'Warnings & Actions': [
-                    'max_warnings', 'mute_duration', 'ban_duration',
-                    'warn_on_links', 'mute_on_spam', 'ban_on_flood'
-                ],
-                'Spam & Flood Protection': [
-                    'anti_spam_threshold', 'anti_flood_threshold',
-                    'delete_spam_messages', 'delete_flood_messages'
-                ],
-                'Content Filtering': [
-                    'anti_link_enabled', 'anti_forward_enabled', 'anti_bot_enabled'
-                ],
-                'Security & Protection': [
-                    'raid_protection', 'raid_threshold', 'raid_time_window',
-                    'require_captcha', 'captcha_timeout', 'emergency_lock_enabled'
-                ],
-                'Notifications & Logging': [
-                    'notify_admins', 'log_moderation'
-                ],
-                'Messages & Rules': [
-                    'welcome_message_enabled', 'goodbye_message_enabled',
-                    'rules_enforced', 'rules_message'
-                ],
-                'Permissions': [
-                    'allow_admin_bypass'
-                ]
-            }
-            
-            for category, setting_keys in categories.items():
+            for category, setting_keys in _REPORT_CATEGORIES:
                 report_lines.append(f"**{category}:**")
                 
                 for key in setting_keys:
                     if key in settings:
                         value = settings[key]
-                        description = await self.get_setting_description(key)
                         
                         # Format value nicely
                         if isinstance(value, bool):
@@ -6,10 +6,12 @@ Group admin service toggle controls
 """
 
 import logging
+from datetime import datetime
 from typing import Dict, Any
 
 from config import Config
 from storage.json_engine import JSONEngine
+from storage.json_cache import json_cache, admin_ids
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +25,7 @@ class ServiceTogglePanel:
         """Get all available services"""
         try:
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
+            group_services = json_cache.load(group_services_path, {})
             
             return group_services.get('services', {})
         
@@ -35,7 +37,8 @@ class ServiceTogglePanel:
         """Get current service status for a group"""
         try:
             group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
-            group_services = JSONEngine.load_json(group_services_path, {})
+            # Read-only; parsed again only after the file changes
+            group_services = json_cache.load(group_services_path, {})
             
             group_key = str(group_id)
             
@@ -125,13 +128,42 @@ class ServiceTogglePanel:
                 return False
             
             services = await self.get_available_services()
-            results = []
             
-            for service in services:
-                result = await self.toggle_service(group_id, service, enabled, admin_id)
-                results.append(result)
+            group_services_path = self.config.DATA_DIR / "groups" / "group_services.json"
+            group_services = JSONEngine.load_json(group_services_path, {})
+            
+            group_key = str(group_id)
+            
+            # Initialize structures if not exists
+            if 'group_services' not in group_services:
+                group_services['group_services'] = {}
+            
+            if group_key not in group_services['group_services']:
+                group_services['group_services'][group_key] = {}
             
-            return all(results)
+            # Update every service in memory, then save once
+            group_overrides = group_services['group_services'][group_key]
+            updated_at = self._get_timestamp()
+            
+            for service, service_config in services.items():
+                group_overrides[service] = {
+                    'enabled': enabled,
+                    'description': service_config.get('description', ''),
+                    'overridden': True,
+                    'updated_by': admin_id,
+                    'updated_at': updated_at
+                }
+            
+            # Save changes
+            if not JSONEngine.save_json(group_services_path, group_services):
+                return False
+            
+            logger.info(
+                f"All {len(services)} services {'enabled' if enabled else 'disabled'} "
+                f"for group {group_id} by admin {admin_id}"
+            )
+            
+            return True
         
         except Exception as e:
             logger.error(f"Failed to toggle all services: {e}")
@@ -179,12 +211,8 @@ class ServiceTogglePanel:
             
             # Check group admins
             group_admins_path = self.config.DATA_DIR / "groups" / "group_admins.json"
-            group_admins = JSONEngine.load_json(group_admins_path, {})
-            
-            group_key = str(group_id)
-            admins = group_admins.get('groups', {}).get(group_key, {}).get('admins', [])
             
-            return user_id in admins
+            return user_id in admin_ids(group_admins_path, group_id)
         
         except Exception as e:
             logger.error(f"Failed to validate group admin: {e}")
@@ -192,7 +220,6 @@ class ServiceTogglePanel:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     async def create_service_status_report(self, group_id: int) -> str:
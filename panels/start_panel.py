@@ -34,7 +34,7 @@ class StartPanel:
         # Prepare welcome message
         if chat_type == 'private':
             welcome_text = await self._get_private_welcome(user_id, role)
-            keyboard = await self.keyboard.get_private_keyboard(user_id, role)
+            keyboard = self.keyboard.get_private_keyboard(user_id, role)
         else:
             welcome_text = await self._get_group_welcome(user_id, role, chat_id)
             keyboard = await self.keyboard.get_group_keyboard(user_id, role, chat_id)
@@ -53,9 +53,7 @@ class StartPanel:
         is_owner = user_id == self.config.BOT_OWNER_ID
         
         # Check if user is bot admin
-        from storage.json_engine import JSONEngine
-        bot_admins = JSONEngine.load_json(self.config.JSON_PATHS['bot_admins'], {})
-        is_admin = user_id in bot_admins.get('admins', [])
+        is_admin = self.keyboard.is_bot_admin(user_id)
         
         welcome = f"""
 🌟 <b>Welcome to {self.config.BOT_NAME}!</b> 🌟
@@ -10,10 +10,17 @@ from .json_engine import JSONEngine
 from .file_lock import FileLock
 from .backup import BackupManager
 from .restore import RestoreManager
+from .write_cache import JSONWriteCache, write_cache
+from .json_cache import JSONReadCache, json_cache, admin_ids
 
 __all__ = [
     'JSONEngine',
     'FileLock',
     'BackupManager',
     'RestoreManager',
+    'JSONWriteCache',
+    'write_cache',
+    'JSONReadCache',
+    'json_cache',
+    'admin_ids',
 ]
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - JSON Read Cache
+Parsed JSON cache invalidated by file modification
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+
+from .json_engine import JSONEngine
+
+logger = logging.getLogger(__name__)
+
+class JSONReadCache:
+    """Read-only JSON cache
+    
+    Parsed files are reused while their modification time and size are
+    unchanged. Callers share the cached data and must not modify it; use
+    JSONEngine.load_json when the result will be changed and saved.
+    """
+    
+    def __init__(self, max_entries: int = 64, max_file_size: int = 256 * 1024):
+        self.max_entries = max_entries
+        self.max_file_size = max_file_size
+        # path -> ((mtime_ns, size), data), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def load(self, file_path: Union[str, Path], default: Any = None) -> Any:
+        """Load a JSON file, reusing the parsed data while it is unchanged"""
+        file_path = Path(file_path)
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Missing files go through JSONEngine so defaults are saved
+            return JSONEngine.load_json(file_path, default)
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(file_path)
+                return entry[1]
+        
+        data = JSONEngine.load_json(file_path, default)
+        
+        # Large files are not kept, to bound memory
+        if stat.st_size <= self.max_file_size:
+            with self._lock:
+                self._entries[file_path] = (stamp, data)
+                self._entries.move_to_end(file_path)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        
+        return data
+    
+    def invalidate(self, file_path: Optional[Union[str, Path]] = None):
+        """Forget one cached file, or all of them"""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(file_path), None)
+
+# Shared cache for read-only lookups
+json_cache = JSONReadCache()
+
+# (path, group key) -> (parsed file the set was built from, admin ids). The
+# read cache hands back the same object until the file changes, so an
+# identity check is enough to know the set is current.
+_admin_sets: Dict[Tuple[Path, Optional[str]], Tuple[Any, FrozenSet[int]]] = {}
+
+def admin_ids(file_path: Union[str, Path], group_id: Optional[int] = None) -> FrozenSet[int]:
+    """Admin ids from an admins file, rebuilt only when the file changes
+    
+    Without a group id the file is read as {'admins': [...]}, as in
+    bot_admins.json; with one, as {'groups': {id: {'admins': [...]}}}, as
+    in group_admins.json.
+    """
+    file_path = Path(file_path)
+    group_key = None if group_id is None else str(group_id)
+    data = json_cache.load(file_path, {})
+    
+    cached = _admin_sets.get((file_path, group_key))
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    
+    if group_key is None:
+        admins = data.get('admins', [])
+    else:
+        admins = data.get('groups', {}).get(group_key, {}).get('admins', [])
+    
+    ids = frozenset(admins)
+    _admin_sets[(file_path, group_key)] = (data, ids)
+    return ids
@@ -5,6 +5,7 @@ Blue Rose Bot - JSON Engine
 JSON file management with atomic writes and locking
 """
 
+import asyncio
 import json
 import os
 import logging
@@ -25,6 +26,10 @@ class JSONEngine:
     _file_locks = {}
     _global_lock = threading.RLock()
     
+    # Bounds concurrent worker-thread file operations, and so open handles
+    _io_limit = 32
+    _io_semaphore = asyncio.Semaphore(_io_limit)
+    
     @staticmethod
     def load_json(file_path: Union[str, Path], default: Any = None) -> Any:
         """Load JSON file with error handling"""
@@ -72,6 +77,55 @@ class JSONEngine:
     def save_json(file_path: Union[str, Path], data: Any, 
                  indent: int = 2, ensure_ascii: bool = False) -> bool:
         """Save data to JSON file with atomic write"""
+        try:
+            payload = JSONEngine.encode_json(data, indent=indent, ensure_ascii=ensure_ascii)
+        except Exception as e:
+            logger.error(f"Failed to save JSON {file_path}: {e}")
+            return False
+        
+        return JSONEngine.save_encoded_json(file_path, payload)
+    
+    @staticmethod
+    async def save_json_async(file_path: Union[str, Path], data: Any,
+                              indent: int = 2, ensure_ascii: bool = False) -> bool:
+        """Save data to JSON file without blocking the event loop"""
+        # Encode on the caller's thread, where the data is owned, and only
+        # hand the write to a worker thread
+        try:
+            payload = JSONEngine.encode_json(data, indent=indent, ensure_ascii=ensure_ascii)
+        except Exception as e:
+            logger.error(f"Failed to save JSON {file_path}: {e}")
+            return False
+        
+        return await JSONEngine.run_io(JSONEngine.save_encoded_json, file_path, payload)
+    
+    @staticmethod
+    async def run_io(func, *args) -> Any:
+        """Run a blocking file operation in a worker thread"""
+        async with JSONEngine._io_semaphore:
+            return await asyncio.to_thread(func, *args)
+    
+    @staticmethod
+    def configure_io_limit(size: int):
+        """Set how many file operations may run in worker threads at once"""
+        if size < 1:
+            raise ValueError("I/O limit must be at least 1")
+        
+        # Operations already waiting keep the previous semaphore
+        JSONEngine._io_limit = size
+        JSONEngine._io_semaphore = asyncio.Semaphore(size)
+    
+    @staticmethod
+    def encode_json(data: Any, indent: int = 2, ensure_ascii: bool = False) -> str:
+        """Encode data as JSON text"""
+        # Encode in one shot and write once; json.dump would issue a write
+        # per encoded chunk
+        return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii,
+                          default=JSONEngine._json_serializer)
+    
+    @staticmethod
+    def save_encoded_json(file_path: Union[str, Path], payload: str) -> bool:
+        """Save already encoded JSON text with atomic write"""
         try:
             file_path = Path(file_path)
             
@@ -90,12 +144,15 @@ class JSONEngine:
                 try:
                     # Write to temporary file
                     with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, 
-                                 default=JSONEngine._json_serializer)
+                        f.write(payload)
                     
                     # Atomic replace
                     os.replace(temp_path, file_path)
                     
+                    # Drop any cached parse, even if the stamp looks unchanged
+                    from .json_cache import json_cache
+                    json_cache.invalidate(file_path)
+                    
                     logger.debug(f"Saved JSON: {file_path}")
                     return True
                     
@@ -331,9 +388,11 @@ class JSONEngine:
     
     @staticmethod
     def force_save_all():
-        """Force save all pending changes (placeholder)"""
-        # In a real implementation, this would save all cached data
-        logger.debug("Force save all called")
+        """Force save all pending changes"""
+        from .write_cache import write_cache
+        
+        saved = write_cache.flush()
+        logger.debug(f"Force save all wrote {saved} files")
         return True
     
     @staticmethod
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - JSON Write Cache
+Write-behind cache for JSON files updated on hot paths
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .json_engine import JSONEngine
+
+logger = logging.getLogger(__name__)
+
+class JSONWriteCache:
+    """Write-behind JSON cache
+    
+    Files are loaded once and then updated in memory. Dirty files are
+    written back by a periodic flush, or as soon as enough changes have
+    piled up, instead of on every update. Scheduled flushes encode on the
+    event loop, where the data is mutated, and write in a worker thread.
+    Writes are serialized, and a payload is dropped once a newer one has
+    been encoded for the same file, so a slow flush cannot land after a
+    later one. At most max_entries files are kept; the least recently
+    used clean files are dropped and reloaded from disk when next needed.
+    """
+    
+    def __init__(self, max_pending: int = 50, max_entries: int = 256):
+        self.max_pending = max_pending
+        self.max_entries = max_entries
+        # path -> data, least recently used first
+        self._data: Dict[Path, Any] = OrderedDict()
+        self._dirty: Set[Path] = set()
+        # Encoded but not yet written, with the generation of the newest
+        # payload; kept so nobody reloads a stale file
+        self._writing: Dict[Path, int] = {}
+        self._generation = 0
+        self._pending = 0
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def get(self, file_path: Union[str, Path], default: Any = None) -> Any:
+        """Get the cached data for a file, loading it on first use"""
+        file_path = Path(file_path)
+        
+        with self._lock:
+            data = self._data.get(file_path)
+            if data is None:
+                data = self._data[file_path] = JSONEngine.load_json(file_path, default)
+                self._evict(keep=file_path)
+            else:
+                self._data.move_to_end(file_path)
+            return data
+    
+    def _evict(self, keep: Path):
+        """Drop least recently used clean files beyond max_entries"""
+        excess = len(self._data) - self.max_entries
+        if excess <= 0:
+            return
+        
+        for file_path in list(self._data):
+            if excess <= 0:
+                break
+            if (file_path != keep and file_path not in self._dirty
+                    and file_path not in self._writing):
+                del self._data[file_path]
+                excess -= 1
+    
+    def mark_dirty(self, file_path: Union[str, Path]):
+        """Mark a cached file as changed"""
+        with self._lock:
+            self._dirty.add(Path(file_path))
+            self._pending += 1
+            if self._pending >= self.max_pending:
+                if self._flush_task is None:
+                    self.flush()
+                else:
+                    self._wakeup.set()
+    
+    def flush(self) -> int:
+        """Write all dirty files to disk"""
+        return self._write(self._encode_dirty())
+    
+    async def flush_async(self) -> int:
+        """Write all dirty files to disk without blocking the event loop"""
+        return await JSONEngine.run_io(self._write, self._encode_dirty())
+    
+    def _encode_dirty(self) -> List[Tuple[Path, int, str]]:
+        """Encode dirty files and mark them clean"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            payloads = [
+                (file_path, generation, JSONEngine.encode_json(self._data[file_path]))
+                for file_path in self._dirty
+            ]
+            for file_path in self._dirty:
+                self._writing[file_path] = generation
+            self._dirty.clear()
+            self._pending = 0
+            return payloads
+    
+    def _write(self, payloads: List[Tuple[Path, int, str]]) -> int:
+        """Write encoded files, keeping failed ones dirty"""
+        saved = 0
+        with self._write_lock:
+            for file_path, generation, payload in payloads:
+                # A newer payload for this file is pending or already written
+                if self._writing.get(file_path) != generation:
+                    continue
+                
+                ok = JSONEngine.save_encoded_json(file_path, payload)
+                with self._lock:
+                    if self._writing.get(file_path) == generation:
+                        del self._writing[file_path]
+                    if ok:
+                        saved += 1
+                    else:
+                        self._dirty.add(file_path)
+        
+        if saved:
+            logger.debug(f"Flushed {saved} cached JSON files")
+        return saved
+    
+    async def schedule_flushes(self, interval_seconds: float = 2.0):
+        """Schedule regular flushes of dirty files"""
+        logger.info(f"Scheduled JSON cache flushes every {interval_seconds} seconds")
+        
+        async def flush_task():
+            while True:
+                try:
+                    # Flush on the interval, or early once enough changes
+                    # are pending
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), interval_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    await self.flush_async()
+                except Exception as e:
+                    logger.error(f"Scheduled JSON cache flush failed: {e}")
+        
+        # Start the task
+        self._flush_task = asyncio.create_task(flush_task())
+        
+        return True
+    
+    async def close(self) -> int:
+        """Stop scheduled flushes and write what is still dirty"""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        # A cancelled flush may still be writing in its worker thread; the
+        # final write waits for it and drops anything it has superseded
+        return await self.flush_async()
+
+# Shared cache for moderation records, logs and group template edits
+write_cache = JSONWriteCache()
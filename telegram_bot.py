@@ -6,6 +6,7 @@ Main Telegram bot handler with webhook/polling support
 """
 
 import asyncio
+import json
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -541,6 +542,14 @@ Thank you for adding me to <b>{chat.title}</b>!
         except Exception as e:
             logger.error(f"Failed to execute action {action.get('action')}: {e}")
     
+    def _serialize_reply_markup(self, reply_markup):
+        """Serialize dict keyboards straight to JSON for the Bot API"""
+        # telebot passes strings through untouched, so dict layouts skip
+        # the round trip through InlineKeyboardButton objects
+        if isinstance(reply_markup, dict):
+            return json.dumps(reply_markup)
+        return reply_markup
+    
     async def _execute_send_message(self, action: Dict[str, Any], default_chat_id: Optional[int] = None):
         """Execute send_message action"""
         chat_id = action.get('chat_id', default_chat_id)
@@ -552,27 +561,11 @@ Thank you for adding me to <b>{chat.title}</b>!
         if not chat_id or not text:
             return
         
-        # Convert reply_markup if it's a dict
-        if isinstance(reply_markup, dict):
-            if 'inline_keyboard' in reply_markup:
-                markup = telebot_types.InlineKeyboardMarkup()
-                for row in reply_markup['inline_keyboard']:
-                    keyboard_row = []
-                    for button in row:
-                        keyboard_row.append(
-                            telebot_types.InlineKeyboardButton(
-                                text=button['text'],
-                                callback_data=button['callback_data']
-                            )
-                        )
-                    markup.row(*keyboard_row)
-                reply_markup = markup
-        
         await self.bot.send_message(
             chat_id=chat_id,
             text=text,
             parse_mode=parse_mode,
-            reply_markup=reply_markup,
+            reply_markup=self._serialize_reply_markup(reply_markup),
             reply_to_message_id=reply_to_message_id,
         )
     
@@ -592,7 +585,7 @@ Thank you for adding me to <b>{chat.title}</b>!
             message_id=message_id,
             text=text,
             parse_mode=parse_mode,
-            reply_markup=reply_markup,
+            reply_markup=self._serialize_reply_markup(reply_markup),
         )
     
     async def _execute_answer_callback(self, action: Dict[str, Any]):
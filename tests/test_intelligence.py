@@ -6,6 +6,7 @@ Tests for intelligence modules
 """
 
 import unittest
+import asyncio
 from unittest.mock import Mock, patch
 
 from intelligence.question_detector import QuestionDetector
@@ -93,6 +94,43 @@ class TestSimilarityEngine(unittest.TestCase):
         similar = await self.engine.find_similar(query, texts, threshold=0.5)
         self.assertGreater(len(similar), 0)
         self.assertEqual(similar[0][0], "hello world")
+    
+    def test_calculate_batch(self):
+        """Test batch scoring matches pairwise scoring"""
+        query = "the cat sat on the mat"
+        texts = ["the cat sat on the rug", "", "dogs bark loudly", "the cat sat on the mat"]
+        
+        for method in ['cosine', 'jaccard', 'levenshtein', 'combined']:
+            scores = asyncio.run(self.engine.calculate_batch(query, texts, method))
+            expected = [asyncio.run(SimilarityEngine().calculate(query, text, method))
+                        for text in texts]
+            
+            self.assertEqual(len(scores), len(texts))
+            for score, reference in zip(scores, expected):
+                self.assertAlmostEqual(score, reference)
+    
+    def test_cluster_similar_texts_runs_inline(self):
+        """Clustering groups texts without starting the worker pool"""
+        texts = ["the cat sat on the mat", "dogs bark loudly", "the cat sat on the mat"] * 20
+        
+        clusters = asyncio.run(self.engine.cluster_similar_texts(texts, threshold=0.6))
+        
+        self.assertEqual(sorted(len(cluster) for cluster in clusters), [20, 40])
+        self.assertIsNone(self.engine._executor)
+    
+    def test_close_shuts_down_worker_pool(self):
+        """close() stops the pool started by a large batch"""
+        texts = ["hello world"] * (self.engine.parallel_min_items * 2)
+        self.engine.max_workers = 2
+        
+        asyncio.run(self.engine.find_similar("hello world", texts))
+        executor = self.engine._executor
+        self.assertIsNotNone(executor)
+        
+        self.engine.close()
+        self.assertIsNone(self.engine._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - Keyboard Tests
+Smoke tests for keyboard layouts
+"""
+
+import unittest
+
+import config  # noqa: F401  (storage expects config to load first)
+import keyboards
+from keyboards.admin_menu import AdminMenuKeyboard
+from keyboards.confirmation import ConfirmationKeyboard
+from keyboards.group_admin_menu import GroupAdminMenu
+from keyboards.payment_menu import PaymentMenu
+
+class TestKeyboardPackage(unittest.TestCase):
+    """Test the keyboards package exports"""
+    
+    def test_package_exports(self):
+        """Every name in __all__ resolves"""
+        for name in keyboards.__all__:
+            self.assertTrue(hasattr(keyboards, name), name)
+    
+    def test_group_admin_main_menu(self):
+        """Group admin menu carries the group id in its callbacks"""
+        layout = GroupAdminMenu.main_menu(-100123)
+        rows = layout['inline_keyboard']
+        
+        self.assertTrue(rows)
+        self.assertEqual(rows[0][0]['callback_data'], "group_admin:service_control:-100123")
+        self.assertEqual(rows[-1][-1]['callback_data'], "main_menu")
+    
+    def test_payment_main_menu(self):
+        """Payment menu lays buttons out two per row"""
+        rows = PaymentMenu.main_menu()['inline_keyboard']
+        
+        self.assertTrue(rows)
+        self.assertTrue(all(1 <= len(row) <= 2 for row in rows))
+    
+    def test_shared_rows_are_immutable(self):
+        """A caller cannot grow a layout that later calls share"""
+        layouts = (
+            PaymentMenu.main_menu(),
+            GroupAdminMenu.main_menu(1),
+            AdminMenuKeyboard().get_dashboard_keyboard(),
+            AdminMenuKeyboard().get_group_list_keyboard(1, 2),
+            ConfirmationKeyboard.yes_no('ban', '1'),
+            ConfirmationKeyboard.restart_shutdown(),
+        )
+        for layout in layouts:
+            with self.assertRaises(AttributeError):
+                layout['inline_keyboard'].append(())
+            layout['inline_keyboard'] = ()
+        
+        self.assertTrue(PaymentMenu.main_menu()['inline_keyboard'])
+        self.assertTrue(GroupAdminMenu.main_menu(1)['inline_keyboard'])
+        self.assertTrue(AdminMenuKeyboard().get_dashboard_keyboard()['inline_keyboard'])
+        self.assertTrue(ConfirmationKeyboard.yes_no('ban', '1')['inline_keyboard'])
+
+if __name__ == '__main__':
+    unittest.main()
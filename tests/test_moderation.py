@@ -5,10 +5,12 @@ Blue Rose Bot - Moderation Tests
 Tests for moderation modules
 """
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
+from moderation.anti_link import AntiLink
 from moderation.anti_spam import AntiSpam
 from moderation.auto_warn import AutoWarn
 
@@ -47,11 +49,10 @@ class TestAutoWarn(unittest.TestCase):
     def setUp(self):
         self.auto_warn = AutoWarn()
     
-    @patch('moderation.auto_warn.JSONEngine')
-    async def test_warning_issuance(self, mock_json):
+    @patch('moderation.auto_warn.write_cache')
+    async def test_warning_issuance(self, mock_cache):
         """Test warning issuance"""
-        mock_json.load_json.return_value = {}
-        mock_json.save_json.return_value = True
+        mock_cache.get.return_value = {}
         
         result = await self.auto_warn.issue_warning(
             user_id=123456,
@@ -63,5 +64,25 @@ class TestAutoWarn(unittest.TestCase):
         self.assertTrue(result['success'])
         self.assertEqual(result['total_warnings'], 1)
 
+class TestAntiLink(unittest.TestCase):
+    """Test Anti-Link system"""
+    
+    def setUp(self):
+        self.anti_link = AntiLink()
+    
+    def test_trailing_punctuation_allowed(self):
+        """Test allowed links followed by punctuation"""
+        for text in ('see https://github.com.',
+                     '(https://github.com)',
+                     'https://github.com, ok'):
+            result = asyncio.run(self.anti_link.check_links({'text': text}, {}))
+            self.assertTrue(result['has_links'], text)
+            self.assertEqual(result['blocked_urls'], [], text)
+    
+    def test_blocked_link(self):
+        """Test links to other domains are blocked"""
+        result = asyncio.run(self.anti_link.check_links({'text': 'visit https://spam.example.'}, {}))
+        self.assertEqual(len(result['blocked_urls']), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
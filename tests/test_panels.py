@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - Panel Tests
+Tests for admin panels
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from config import Config
+from storage.json_engine import JSONEngine
+from panels.bot_admin_panel.feature_override import FeatureOverridePanel
+
+class TestFeatureOverride(unittest.TestCase):
+    """Test feature override edits"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        
+        class TempConfig(Config):
+            DATA_DIR = Path(self.temp_dir.name)
+        
+        self.panel = FeatureOverridePanel()
+        self.panel.config = TempConfig
+        self.services_path = TempConfig.DATA_DIR / "groups" / "group_services.json"
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_concurrent_overrides_are_all_saved(self):
+        """Concurrent overrides for one group do not save over each other"""
+        features = [f"feature_{i}" for i in range(5)]
+        
+        async def override_all():
+            return await asyncio.gather(*(
+                self.panel.override_feature(-100123, feature, True, Config.BOT_OWNER_ID)
+                for feature in features
+            ))
+        
+        results = asyncio.run(override_all())
+        saved = JSONEngine.load_json(self.services_path, {})
+        
+        self.assertEqual(results, [True] * len(features))
+        self.assertEqual(sorted(saved['group_services']['-100123']), features)
+    
+    def test_concurrent_override_and_reset(self):
+        """A reset racing an override keeps the other feature"""
+        owner = Config.BOT_OWNER_ID
+        asyncio.run(self.panel.override_feature(-100123, 'welcome', True, owner))
+        
+        async def edit():
+            return await asyncio.gather(
+                self.panel.reset_feature(-100123, 'welcome', owner),
+                self.panel.override_feature(-100123, 'goodbye', False, owner),
+            )
+        
+        self.assertEqual(asyncio.run(edit()), [True, True])
+        saved = JSONEngine.load_json(self.services_path, {})
+        self.assertEqual(list(saved['group_services']['-100123']), ['goodbye'])
+
+if __name__ == '__main__':
+    unittest.main()
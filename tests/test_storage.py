@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Blue Rose Bot - Storage Tests
+Tests for the JSON write cache
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import config  # noqa: F401  (storage expects config to load first)
+from storage.json_engine import JSONEngine
+from storage.write_cache import JSONWriteCache
+
+class TestJSONWriteCache(unittest.TestCase):
+    """Test JSON write cache"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+        self.cache = JSONWriteCache(max_pending=3, max_entries=2)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_batches_until_max_pending(self):
+        """Changes are written together once enough are pending"""
+        path = self.dir / "warnings.json"
+        data = self.cache.get(path, {})
+        
+        data['a'] = 1
+        self.cache.mark_dirty(path)
+        data['b'] = 2
+        self.cache.mark_dirty(path)
+        self.assertEqual(JSONEngine.load_json(path), {})
+        
+        data['c'] = 3
+        self.cache.mark_dirty(path)
+        self.assertEqual(JSONEngine.load_json(path), {'a': 1, 'b': 2, 'c': 3})
+    
+    def test_failed_write_is_retried(self):
+        """A file whose write fails stays dirty for the next flush"""
+        path = self.dir / "bans.json"
+        self.cache.get(path, {})['user'] = 'banned'
+        self.cache.mark_dirty(path)
+        
+        with patch.object(JSONEngine, 'save_encoded_json', return_value=False):
+            self.assertEqual(self.cache.flush(), 0)
+        self.assertEqual(JSONEngine.load_json(path), {})
+        
+        self.assertEqual(self.cache.flush(), 1)
+        self.assertEqual(JSONEngine.load_json(path), {'user': 'banned'})
+    
+    def test_eviction_keeps_dirty_entries(self):
+        """Only clean files are dropped once max_entries is exceeded"""
+        dirty_path = self.dir / "dirty.json"
+        self.cache.get(dirty_path, {})['kept'] = True
+        self.cache.mark_dirty(dirty_path)
+        
+        for i in range(4):
+            self.cache.get(self.dir / f"clean_{i}.json", {})
+        
+        self.assertIn(dirty_path, self.cache._data)
+        self.assertLessEqual(len(self.cache._data), 3)
+        self.assertEqual(self.cache.get(dirty_path), {'kept': True})
+    
+    def test_older_payload_does_not_overwrite_newer(self):
+        """A payload written after a newer one for the same file is dropped"""
+        path = self.dir / "templates.json"
+        data = self.cache.get(path, {})
+        
+        data['version'] = 1
+        self.cache.mark_dirty(path)
+        older = self.cache._encode_dirty()
+        
+        data['version'] = 2
+        self.cache.mark_dirty(path)
+        newer = self.cache._encode_dirty()
+        
+        self.assertEqual(self.cache._write(newer), 1)
+        self.assertEqual(self.cache._write(older), 0)
+        self.assertEqual(JSONEngine.load_json(path), {'version': 2})
+        self.assertNotIn(path, self.cache._writing)
+    
+    def test_close_stops_flushes_and_writes_dirty(self):
+        """Closing cancels the flush task and writes pending changes"""
+        path = self.dir / "mutes.json"
+        
+        async def run():
+            await self.cache.schedule_flushes(interval_seconds=60)
+            self.cache.get(path, {})['user'] = 'muted'
+            self.cache.mark_dirty(path)
+            task = self.cache._flush_task
+            
+            saved = await self.cache.close()
+            return task, saved
+        
+        task, saved = asyncio.run(run())
+        
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(self.cache._flush_task)
+        self.assertEqual(saved, 1)
+        self.assertEqual(JSONEngine.load_json(path), {'user': 'muted'})
+
+if __name__ == '__main__':
+    unittest.main()